@@ -1,4 +1,9 @@
+import random
+from datetime import date
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, FrozenSet, Final, Optional, Tuple
 
 # ============================================================================
 # DIRETÓRIO RAIZ DO PROJETO
@@ -59,6 +64,11 @@ DOWNLOADER = {
         # Valores comuns: 44100 (CD quality), 48000 (padrão YouTube), 96000 (high-res)
         # Nota: valores maiores = melhor qualidade, mas arquivos maiores
         'sample_rate_hz': 0,
+        
+        # Fragmentos baixados em paralelo (streams DASH/HLS fragmentados)
+        # 1 = sequencial | N = até N fragmentos simultâneos por vídeo
+        # Nota: multiplica-se por 'videos_simultaneos'; valores altos aumentam o risco de throttling
+        'fragmentos_simultaneos': 4,
     },
     
     # ------------------------------------------------------------------------
@@ -138,6 +148,7 @@ DOWNLOADER = {
     'delays': {
         # Delay entre LINKS DO CSV (vídeos individuais, playlists, canais)
         # O tempo real será aleatório entre mínimo e máximo (valores contínuos)
+        # Conta entre o início de um link e o início do próximo (o tempo de download já desconta)
         'entre_links_csv': {
             'minimo_segundos': 5,   # Recomendado mínimo: 5s
             'maximo_segundos': 20,  # Recomendado máximo: 20-30s
@@ -145,12 +156,55 @@ DOWNLOADER = {
         
         # Delay entre VÍDEOS DENTRO de playlists/canais (links compostos)
         # Aplica-se apenas quando baixando múltiplos vídeos de uma mesma fonte
+        # Ritmo global: com 'videos_simultaneos' > 1, os inícios continuam espaçados por este delay
         'entre_videos_playlist': {
             'minimo_segundos': 3,   # Recomendado mínimo: 3s
             'maximo_segundos': 10,  # Recomendado máximo: 10-15s
         },
     },
     
+    # ------------------------------------------------------------------------
+    # Rede
+    # ------------------------------------------------------------------------
+    'rede': {
+        # Timeout de socket em segundos (conexões ociosas além disso são refeitas)
+        'timeout_segundos': 30,
+        
+        # Novas tentativas em falhas transitórias de rede
+        # Aplica-se a downloads HTTP, fragmentos DASH/HLS e extração de metadados
+        'tentativas': 10,
+        
+        # Pausa global ao receber HTTP 429 (Too Many Requests) do YouTube
+        # Todas as threads adiam o próximo início por este tempo
+        'pausa_http_429_segundos': 60,
+    },
+    
+    # ------------------------------------------------------------------------
+    # Concorrência
+    # ------------------------------------------------------------------------
+    'concorrencia': {
+        # Vídeos processados ao mesmo tempo (de qualquer link do CSV, inclusive playlists/canais)
+        # 1 = sequencial | N = até N downloads simultâneos (inícios espaçados pelos delays)
+        # Recomendado: 2-4 (valores altos aumentam o risco de bloqueio por IP)
+        'videos_simultaneos': 3,
+    },
+    
+    # ------------------------------------------------------------------------
+    # Cache de Vídeos Avaliados
+    # ------------------------------------------------------------------------
+    'cache': {
+        # Consultar o cache (arquivos/links_download/cache_videos.sqlite) antes de
+        # extrair vídeos de playlists/canais: rejeitados em execuções anteriores
+        # (duração, data ou sem legendas) são pulados sem nenhuma requisição
+        # False = ignora o cache nesta execução (equivale a um "refresh"; continua gravando)
+        'consultar': True,
+        
+        # Dias até reavaliar vídeos rejeitados por falta de legendas
+        # (legendas podem ser adicionadas depois pelo autor do vídeo)
+        # Duração e data são sempre reavaliadas com os filtros atuais
+        'revalidar_sem_legendas_dias': 7,
+    },
+    
     # ------------------------------------------------------------------------
     # Comportamento Geral
     # ------------------------------------------------------------------------
@@ -489,6 +543,11 @@ STT_WHISPER = {
     # Nota: GPU acelera significativamente (6x mais rápido que large-v3)
     'device': 'auto',
     
+    # Quantização INT8 dinâmica das camadas Linear quando rodando em CPU
+    # True = ~metade da memória e inferência mais rápida em CPU (pequena perda de precisão)
+    # Ignorado em GPU (GPU usa float16)
+    'quantizar_int8_cpu': False,
+    
     # ------------------------------------------------------------------------
     # Batch Processing (Processamento em Lote)
     # ------------------------------------------------------------------------
@@ -532,6 +591,16 @@ STT_WHISPER = {
 # ============================================================
 STT_WAV2VEC2= {
     "device": "auto",  # Dispositivo de processamento: auto, cpu, gpu
+    
+    # Quantização INT8 dinâmica das camadas Linear em CPU (ignorado em GPU)
+    # True = modelo ~metade do tamanho e mais rápido em CPU (pequena perda de precisão)
+    "quantizar_int8_cpu": False,
+    
+    # Batch Processing: quantos segmentos transcrever por chamada do pipeline
+    # "auto" = 8 em GPU; em CPU sempre 1 (padding sem ganho de throughput)
+    "batch": {
+        "batch_size": "auto",
+    },
 }
 
 
@@ -761,4 +830,211 @@ SOX_NORMALIZER = {
     # 
     # Recomendação: -40 dB para áudio limpo, -50 dB para áudio ruidoso
     "silence_threshold_db": -40,
-}
\ No newline at end of file
+}
+
+
+# ============================================================================
+# VALIDAÇÃO E CONGELAMENTO DA CONFIGURAÇÃO
+# ============================================================================
+# Executado uma única vez no import: erros de configuração falham na partida
+# (e não no meio do pipeline) e os blocos ficam somente-leitura, podendo ser
+# compartilhados por referência entre todos os módulos.
+
+_DEVICES = ('auto', 'gpu', 'cpu')
+
+
+def _exigir(condicao: bool, mensagem: str) -> None:
+    if not condicao:
+        raise ValueError(f"ERRO no config.py: {mensagem}")
+
+
+def _converter_data(data_str: str, campo: str) -> Optional[date]:
+    """Converte 'DD-MM-AAAA' em date; '0' (sem filtro) retorna None"""
+    if data_str == '0':
+        return None
+    try:
+        dia, mes, ano = (int(p) for p in data_str.split('-'))
+        _exigir(1900 <= ano <= 2100, f"{campo} fora do intervalo: '{data_str}'")
+        return date(ano, mes, dia)
+    except (ValueError, TypeError):
+        raise ValueError(f"ERRO no config.py: {campo} inválida: '{data_str}' (formato: DD-MM-AAAA)")
+
+
+def _validar_batch(valor, campo: str) -> None:
+    _exigir(valor == 'auto' or (isinstance(valor, int) and valor >= 1),
+            f"{campo} deve ser 'auto' ou inteiro >= 1 (atual: {valor!r})")
+
+
+def _validar_config() -> None:
+    _exigir(MASTER['segmentacao'] in ('legenda', 'vad', ''),
+            f"MASTER['segmentacao'] inválido: {MASTER['segmentacao']!r}")
+    _exigir(MASTER['cleanup'] in ('all', 'input', 'temp', 'none'),
+            f"MASTER['cleanup'] inválido: {MASTER['cleanup']!r}")
+
+    audio = DOWNLOADER['audio']
+    _exigir(audio['formato'] in ('mp3', 'wav', 'm4a', 'flac', 'opus'),
+            f"DOWNLOADER['audio']['formato'] inválido: {audio['formato']!r}")
+    _exigir(audio['bitrate_kbps'] >= 0, "DOWNLOADER['audio']['bitrate_kbps'] deve ser >= 0")
+    _exigir(audio['sample_rate_hz'] >= 0, "DOWNLOADER['audio']['sample_rate_hz'] deve ser >= 0")
+    _exigir(isinstance(audio['fragmentos_simultaneos'], int) and audio['fragmentos_simultaneos'] >= 1,
+            "DOWNLOADER['audio']['fragmentos_simultaneos'] deve ser inteiro >= 1")
+    _exigir(DOWNLOADER['quantidade']['limit'] >= 0, "DOWNLOADER['quantidade']['limit'] deve ser >= 0")
+
+    for prioridade in DOWNLOADER['legendas']['prioridade']:
+        partes = prioridade.rsplit('-', 1)
+        _exigir(len(partes) == 2 and partes[1] in ('manual', 'auto'),
+                f"prioridade de legenda inválida: '{prioridade}' (esperado: 'idioma-manual' ou 'idioma-auto')")
+
+    duracao = DOWNLOADER['filtros']['duracao']
+    _exigir(0 <= duracao['minima_segundos'] <= duracao['maxima_segundos'],
+            "DOWNLOADER['filtros']['duracao']: mínima deve ser <= máxima")
+    _converter_data(DOWNLOADER['filtros']['data_upload']['minima'], "Data mínima")
+    _converter_data(DOWNLOADER['filtros']['data_upload']['maxima'], "Data máxima")
+
+    _exigir(DOWNLOADER['rede']['timeout_segundos'] > 0, "DOWNLOADER['rede']['timeout_segundos'] deve ser > 0")
+    _exigir(isinstance(DOWNLOADER['rede']['tentativas'], int) and DOWNLOADER['rede']['tentativas'] >= 0,
+            "DOWNLOADER['rede']['tentativas'] deve ser inteiro >= 0")
+    _exigir(DOWNLOADER['rede']['pausa_http_429_segundos'] >= 0,
+            "DOWNLOADER['rede']['pausa_http_429_segundos'] deve ser >= 0")
+    _exigir(DOWNLOADER['cache']['revalidar_sem_legendas_dias'] >= 0,
+            "DOWNLOADER['cache']['revalidar_sem_legendas_dias'] deve ser >= 0")
+    _exigir(isinstance(DOWNLOADER['concorrencia']['videos_simultaneos'], int)
+            and DOWNLOADER['concorrencia']['videos_simultaneos'] >= 1,
+            "DOWNLOADER['concorrencia']['videos_simultaneos'] deve ser inteiro >= 1")
+
+    for nome, delay in DOWNLOADER['delays'].items():
+        _exigir(0 <= delay['minimo_segundos'] <= delay['maximo_segundos'],
+                f"DOWNLOADER['delays']['{nome}']: mínimo deve ser <= máximo")
+
+    _exigir(0 < SEGMENTADOR_AUDIO['min_seg'] <= SEGMENTADOR_AUDIO['max_seg'],
+            "SEGMENTADOR_AUDIO: min_seg deve ser <= max_seg")
+
+    vad = SEGMENTADOR_AUDIO_VAD
+    _exigir(0.0 <= vad['deteccao']['voice_threshold'] <= 1.0,
+            "SEGMENTADOR_AUDIO_VAD['deteccao']['voice_threshold'] deve estar entre 0.0 e 1.0")
+    _exigir(vad['deteccao']['window_size_seconds'] > 0,
+            "SEGMENTADOR_AUDIO_VAD['deteccao']['window_size_seconds'] deve ser > 0")
+    _exigir(0 < vad['segmentos']['min_seg'] <= vad['segmentos']['max_seg'],
+            "SEGMENTADOR_AUDIO_VAD['segmentos']: min_seg deve ser <= max_seg")
+
+    for nome, bloco in (('MOS_FILTER', MOS_FILTER), ('OVERLAP_DETECTOR', OVERLAP_DETECTOR),
+                        ('STT_WHISPER', STT_WHISPER), ('STT_WAV2VEC2', STT_WAV2VEC2),
+                        ('DEEPFILTERNET_DENOISER', DEEPFILTERNET_DENOISER)):
+        _exigir(bloco['device'].lower() in _DEVICES,
+                f"{nome}['device'] inválido: {bloco['device']!r} (use 'auto', 'gpu' ou 'cpu')")
+
+    thresholds = MOS_FILTER['thresholds']
+    _exigir(1.0 <= thresholds['min_threshold'] <= thresholds['max_threshold'] <= 5.0,
+            "MOS_FILTER['thresholds']: esperado 1.0 <= min_threshold <= max_threshold <= 5.0")
+    _validar_batch(MOS_FILTER['batch']['batch_size'], "MOS_FILTER['batch']['batch_size']")
+    _validar_batch(OVERLAP_DETECTOR['batch']['batch_size'], "OVERLAP_DETECTOR['batch']['batch_size']")
+    _validar_batch(STT_WHISPER['batch']['batch_size'], "STT_WHISPER['batch']['batch_size']")
+    _validar_batch(STT_WAV2VEC2['batch']['batch_size'], "STT_WAV2VEC2['batch']['batch_size']")
+    for nome, bloco in (('STT_WHISPER', STT_WHISPER), ('STT_WAV2VEC2', STT_WAV2VEC2)):
+        _exigir(isinstance(bloco['quantizar_int8_cpu'], bool),
+                f"{nome}['quantizar_int8_cpu'] deve ser True ou False")
+    _exigir(OVERLAP_DETECTOR['timeout']['por_audio_segundos'] > 0,
+            "OVERLAP_DETECTOR['timeout']['por_audio_segundos'] deve ser > 0")
+
+    _exigir(0.0 <= SIMILARITY_VALIDATOR['similarity_threshold'] <= 1.0,
+            "SIMILARITY_VALIDATOR['similarity_threshold'] deve estar entre 0.0 e 1.0")
+    _exigir(SIMILARITY_VALIDATOR['metric_type'] in ('wer', 'cer', 'levenshtein_norm'),
+            f"SIMILARITY_VALIDATOR['metric_type'] inválido: {SIMILARITY_VALIDATOR['metric_type']!r}")
+
+    _exigir(set(DEEPFILTERNET_DENOISER['mos_quality_filter']) <= {'alta', 'media', 'baixa'},
+            "DEEPFILTERNET_DENOISER['mos_quality_filter'] aceita apenas 'alta', 'media', 'baixa'")
+    _exigir(DEEPFILTERNET_DENOISER['post_filter'] in (0, 1, 2),
+            "DEEPFILTERNET_DENOISER['post_filter'] deve ser 0, 1 ou 2")
+    _exigir(0.0 <= DEEPFILTERNET_DENOISER['attenuation_limit'] <= 1.0,
+            "DEEPFILTERNET_DENOISER['attenuation_limit'] deve estar entre 0.0 e 1.0")
+
+    _exigir(SOX_NORMALIZER['sample_rate'] > 0, "SOX_NORMALIZER['sample_rate'] deve ser > 0")
+    _exigir(SOX_NORMALIZER['bit_depth'] in (16, 24, 32), "SOX_NORMALIZER['bit_depth'] deve ser 16, 24 ou 32")
+    _exigir(SOX_NORMALIZER['channels'] in (1, 2), "SOX_NORMALIZER['channels'] deve ser 1 ou 2")
+    _exigir(SOX_NORMALIZER['output_format'] in ('wav', 'flac', 'mp3', 'ogg'),
+            f"SOX_NORMALIZER['output_format'] inválido: {SOX_NORMALIZER['output_format']!r}")
+    _exigir(SOX_NORMALIZER['normalize_method'] in ('peak', 'rms', 'loudness'),
+            f"SOX_NORMALIZER['normalize_method'] inválido: {SOX_NORMALIZER['normalize_method']!r}")
+
+
+def _congelar(valor):
+    """Converte dicts em MappingProxyType e listas em tuplas, recursivamente"""
+    if isinstance(valor, dict):
+        return MappingProxyType({chave: _congelar(v) for chave, v in valor.items()})
+    if isinstance(valor, list):
+        return tuple(_congelar(v) for v in valor)
+    return valor
+
+
+_validar_config()
+
+MASTER = _congelar(MASTER)
+DOWNLOADER = _congelar(DOWNLOADER)
+SEGMENTADOR_AUDIO = _congelar(SEGMENTADOR_AUDIO)
+SEGMENTADOR_AUDIO_VAD = _congelar(SEGMENTADOR_AUDIO_VAD)
+MOS_FILTER = _congelar(MOS_FILTER)
+OVERLAP_DETECTOR = _congelar(OVERLAP_DETECTOR)
+STT_WHISPER = _congelar(STT_WHISPER)
+STT_WAV2VEC2 = _congelar(STT_WAV2VEC2)
+TEXT_NORMALIZER = _congelar(TEXT_NORMALIZER)
+SIMILARITY_VALIDATOR = _congelar(SIMILARITY_VALIDATOR)
+DEEPFILTERNET_DENOISER = _congelar(DEEPFILTERNET_DENOISER)
+SOX_NORMALIZER = _congelar(SOX_NORMALIZER)
+
+
+# ============================================================================
+# CONSTANTES PLANAS (valores lidos nos laços de processamento)
+# ============================================================================
+# Leitura direta por nome (um LOAD_GLOBAL) em vez de DOWNLOADER['a']['b']['c']
+
+# Downloader
+LIMITE_POR_FONTE: Final[int] = DOWNLOADER['quantidade']['limit']
+AUDIO_FORMATO: Final[str] = DOWNLOADER['audio']['formato']
+AUDIO_BITRATE_KBPS: Final[int] = DOWNLOADER['audio']['bitrate_kbps']
+AUDIO_SAMPLE_RATE_HZ: Final[int] = DOWNLOADER['audio']['sample_rate_hz']
+AUDIO_FRAGMENTOS_SIMULTANEOS: Final[int] = DOWNLOADER['audio']['fragmentos_simultaneos']
+DURACAO_MIN_SEGUNDOS: Final[int] = DOWNLOADER['filtros']['duracao']['minima_segundos']
+DURACAO_MAX_SEGUNDOS: Final[int] = DOWNLOADER['filtros']['duracao']['maxima_segundos']
+DATA_UPLOAD_MINIMA: Final[str] = DOWNLOADER['filtros']['data_upload']['minima']
+DATA_UPLOAD_MAXIMA: Final[str] = DOWNLOADER['filtros']['data_upload']['maxima']
+# Datas de corte já convertidas (None = sem filtro)
+DATA_UPLOAD_MIN: Final[Optional[date]] = _converter_data(DATA_UPLOAD_MINIMA, "Data mínima")
+DATA_UPLOAD_MAX: Final[Optional[date]] = _converter_data(DATA_UPLOAD_MAXIMA, "Data máxima")
+# Mesmas datas como inteiros AAAAMMDD (formato do upload_date do YouTube); sem filtro = limite aberto
+DATA_UPLOAD_MIN_AAAAMMDD: Final[int] = int(DATA_UPLOAD_MIN.strftime('%Y%m%d')) if DATA_UPLOAD_MIN else 0
+DATA_UPLOAD_MAX_AAAAMMDD: Final[int] = int(DATA_UPLOAD_MAX.strftime('%Y%m%d')) if DATA_UPLOAD_MAX else 99999999
+DELAY_CSV_MIN: Final[float] = DOWNLOADER['delays']['entre_links_csv']['minimo_segundos']
+DELAY_CSV_MAX: Final[float] = DOWNLOADER['delays']['entre_links_csv']['maximo_segundos']
+DELAY_PLAYLIST_MIN: Final[float] = DOWNLOADER['delays']['entre_videos_playlist']['minimo_segundos']
+DELAY_PLAYLIST_MAX: Final[float] = DOWNLOADER['delays']['entre_videos_playlist']['maximo_segundos']
+REDE_TIMEOUT_SEGUNDOS: Final[float] = DOWNLOADER['rede']['timeout_segundos']
+REDE_TENTATIVAS: Final[int] = DOWNLOADER['rede']['tentativas']
+REDE_PAUSA_HTTP_429_SEGUNDOS: Final[float] = DOWNLOADER['rede']['pausa_http_429_segundos']
+VIDEOS_SIMULTANEOS: Final[int] = DOWNLOADER['concorrencia']['videos_simultaneos']
+CACHE_CONSULTAR: Final[bool] = DOWNLOADER['cache']['consultar']
+CACHE_SEM_LEGENDAS_DIAS: Final[float] = DOWNLOADER['cache']['revalidar_sem_legendas_dias']
+DOWNLOADER_SOBRESCREVER: Final[bool] = DOWNLOADER['comportamento']['sobrescrever']
+
+# Prioridade de legendas já decomposta: ('pt-BR-auto' → ('pt-BR', True))
+PRIORIDADE_LEGENDAS: Final[Tuple[Tuple[str, bool], ...]] = tuple(
+    (prioridade.rsplit('-', 1)[0], prioridade.endswith('-auto'))
+    for prioridade in DOWNLOADER['legendas']['prioridade']
+)
+IDIOMAS_LEGENDAS: Final[FrozenSet[str]] = frozenset(idioma for idioma, _ in PRIORIDADE_LEGENDAS)
+
+# Sorteio dos delays anti-bloqueio (limites já ligados, uma chamada C por uso)
+SORTEAR_DELAY_CSV: Final[Callable[[], float]] = partial(random.uniform, DELAY_CSV_MIN, DELAY_CSV_MAX)
+SORTEAR_DELAY_PLAYLIST: Final[Callable[[], float]] = partial(random.uniform, DELAY_PLAYLIST_MIN, DELAY_PLAYLIST_MAX)
+
+# Segmentador VAD
+VAD_VOICE_THRESHOLD: Final[float] = SEGMENTADOR_AUDIO_VAD['deteccao']['voice_threshold']
+VAD_WINDOW_SIZE_SECONDS: Final[float] = SEGMENTADOR_AUDIO_VAD['deteccao']['window_size_seconds']
+VAD_MIN_SPEECH_DURATION_MS: Final[int] = SEGMENTADOR_AUDIO_VAD['criterios']['min_speech_duration_ms']
+VAD_MIN_SILENCE_DURATION_MS: Final[int] = SEGMENTADOR_AUDIO_VAD['criterios']['min_silence_duration_ms']
+VAD_MIN_SILENCE_FOR_SPLIT: Final[float] = SEGMENTADOR_AUDIO_VAD['criterios']['min_silence_for_split']
+VAD_PADDING_INICIO_MS: Final[int] = SEGMENTADOR_AUDIO_VAD['padding']['inicio_ms']
+VAD_PADDING_FIM_MS: Final[int] = SEGMENTADOR_AUDIO_VAD['padding']['fim_ms']
+VAD_MIN_SEG: Final[float] = SEGMENTADOR_AUDIO_VAD['segmentos']['min_seg']
+VAD_MAX_SEG: Final[float] = SEGMENTADOR_AUDIO_VAD['segmentos']['max_seg']
+VAD_TOLERANCIA: Final[float] = SEGMENTADOR_AUDIO_VAD['segmentos']['tolerancia']
+VAD_SOBRESCREVER: Final[bool] = SEGMENTADOR_AUDIO_VAD['comportamento']['sobrescrever']
@@ -6,17 +6,20 @@ Detecta sample rate real vs declarado (upsampling artificial)
 Independente da pipeline - uso standalone
 """
 
+import os
 import json
 import logging
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 
 import numpy as np
-import librosa
-import soundfile as sf
-import matplotlib.pyplot as plt
-from scipy import signal
+
+# librosa, soundfile e matplotlib são importados dentro das funções que os
+# utilizam: o carregamento da pilha numérica/gráfica domina o tempo de
+# inicialização do script e não é necessário em todos os caminhos
 
 # ========================================
 # CONFIGURAÇÕES
@@ -27,6 +30,7 @@ INPUT_DIR = "/home/ubuntu/z_projeto_2026/dataset/audio_dataset/QN7gUP7nYhQ"
 OUTPUT_DIR = "/home/ubuntu/z_projeto_2026/dataset/audio_dataset/QN7gUP7nYhQ"
 # Parâmetros de análise
 ENERGY_THRESHOLD_DB = -60  # Threshold para detectar corte espectral
+DURACAO_AMOSTRA_S = 20  # Trecho central analisado em áudios longos (resolução sr/N ainda < 0.1 Hz)
 FORMATOS_SUPORTADOS = ['.flac', '.mp3', '.wav']
 
 # Visualização
@@ -34,10 +38,32 @@ SHOW_PLOTS = True  # Mostrar gráficos na tela
 SAVE_PLOTS = True  # Salvar PNG
 PAUSE_BETWEEN_FILES = False  # Pausar entre arquivos (aguardar fechar janela)
 DPI = 150  # Qualidade das imagens
+PONTOS_PLOT_ESPECTRO = 8000  # Máximo de pontos desenhados no gráfico do espectro
+
+# Paralelismo (apenas com SHOW_PLOTS = False; com janelas abertas é sempre sequencial)
+NUM_PROCESSOS = 0  # 0 = um processo por núcleo de CPU | 1 = sequencial
 
 # Logging
 LOG_LEVEL = logging.INFO
 
+# Espectrograma (STFT)
+N_FFT_ESPECTROGRAMA = 2048
+HOP_ESPECTROGRAMA = 512
+
+# Bandas de energia [f_min, f_max] em Hz (inclusivas)
+BANDAS_ENERGIA = {
+    '0-8kHz': (0, 8000),
+    '8-16kHz': (8000, 16000),
+    '16-24kHz': (16000, 24000)
+}
+
+# Threads da FFT por processo: -1 = todos os núcleos (modo sequencial);
+# os processos do pool usam 1 para não disputar CPU entre si (ver _inicializar_processo)
+_workers_fft = -1
+
+# Janela Hann periódica (mesma que o librosa gera a cada chamada), criada uma única vez
+_JANELA_STFT = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(N_FFT_ESPECTROGRAMA) / N_FFT_ESPECTROGRAMA)).astype(np.float32)
+
 # ========================================
 # CONFIGURAÇÃO DE LOGGING
 # ========================================
@@ -54,9 +80,68 @@ logger = logging.getLogger(__name__)
 # FUNÇÕES DE ANÁLISE
 # ========================================
 
+# Backend de decodificação por extensão: cada arquivo vai direto ao leitor certo
+_BACKEND_POR_EXTENSAO = {
+    '.wav': 'soundfile',
+    '.flac': 'soundfile',
+    '.ogg': 'soundfile',
+    '.mp3': 'ffmpeg',
+    '.m4a': 'ffmpeg',
+    '.aac': 'ffmpeg',
+}
+
+
+def _carregar_soundfile(audio_path: Path) -> Tuple[np.ndarray, int, int]:
+    """Decodifica via soundfile (WAV/FLAC/OGG, inclusive 24-bit)."""
+    import soundfile as sf
+    # always_2d: sempre (samples, channels), sem heurística de formato
+    audio, sr = sf.read(str(audio_path), always_2d=True, dtype='float32')
+    
+    # Formato (channels, samples) como visão transposta, sem cópia
+    return audio.T, sr, audio.shape[1]
+
+
+def _carregar_ffmpeg(audio_path: Path) -> Tuple[np.ndarray, int, int]:
+    """Decodifica via ffmpeg direto para memória (MP3/M4A/AAC)."""
+    import subprocess
+    
+    # Sample rate e canais nativos (preserva a taxa declarada do arquivo)
+    cmd = [
+        'ffprobe', '-v', 'error', '-select_streams', 'a:0',
+        '-show_entries', 'stream=sample_rate,channels',
+        '-of', 'json', str(audio_path)
+    ]
+    probe = subprocess.run(cmd, capture_output=True, check=True, timeout=60)
+    stream = json.loads(probe.stdout)['streams'][0]
+    sr = int(stream['sample_rate'])
+    canais = int(stream['channels'])
+    
+    # PCM float32 intercalado no stdout: uma única decodificação, sem WAV temporário
+    cmd = [
+        'ffmpeg', '-v', 'error', '-i', str(audio_path),
+        '-f', 'f32le', '-acodec', 'pcm_f32le', 'pipe:1'
+    ]
+    raw = subprocess.run(cmd, capture_output=True, check=True, timeout=300).stdout
+    audio = np.frombuffer(raw, dtype=np.float32).reshape(-1, canais).T  # (channels, samples)
+    return audio, sr, canais
+
+
+def _carregar_librosa(audio_path: Path) -> Tuple[np.ndarray, int, int]:
+    """Decodifica via librosa (último recurso; import pesado, só quando necessário)."""
+    import librosa
+    audio, sr = librosa.load(str(audio_path), sr=None, mono=False, dtype=np.float32)
+    if audio.ndim == 1:
+        audio = audio.reshape(1, -1)
+    return audio, sr, audio.shape[0]
+
+
 def carregar_audio(audio_path: Path) -> Tuple[np.ndarray, int, int]:
     """
-    Carrega arquivo de áudio com múltiplos backends (suporte 24-bit FLAC)
+    Carrega arquivo de áudio escolhendo o backend pela extensão (suporte 24-bit FLAC)
+    
+    WAV/FLAC/OGG vão para o soundfile e MP3/M4A/AAC para o ffmpeg. O soundfile
+    só cede ao ffmpeg quando a libsndfile recusa o arquivo; o librosa fica como
+    último recurso.
     
     Args:
         audio_path: Caminho do arquivo de áudio
@@ -64,101 +149,108 @@ def carregar_audio(audio_path: Path) -> Tuple[np.ndarray, int, int]:
     Returns:
         Tuple (audio_data, sample_rate, num_channels)
     """
-    # Tentativa 1: soundfile direto (melhor para 16-bit)
-    try:
-        import soundfile as sf
-        audio, sr = sf.read(str(audio_path), always_2d=False, dtype='float32')
-        
-        # Detectar canais
-        if len(audio.shape) == 1:
-            num_channels = 1
-            audio = audio.reshape(1, -1)  # Garantir formato (channels, samples)
-        else:
-            num_channels = audio.shape[0] if audio.shape[0] < audio.shape[1] else 1
-            if num_channels == 1 and len(audio.shape) > 1:
-                audio = audio.T
-        
-        logger.info(f"Áudio carregado (soundfile): {audio_path.name}")
-        logger.info(f"  Sample rate: {sr} Hz")
-        logger.info(f"  Canais: {num_channels}")
-        logger.info(f"  Duração: {audio.shape[-1] / sr:.2f}s")
-        
-        return audio, sr, num_channels
-        
-    except Exception as e:
-        logger.warning(f"soundfile falhou: {e}")
+    backend = _BACKEND_POR_EXTENSAO.get(audio_path.suffix.lower(), 'ffmpeg')
+    resultado = None
     
-    # Tentativa 2: librosa (melhor para 24-bit e arquivos grandes)
-    try:
-        audio, sr = librosa.load(str(audio_path), sr=None, mono=False, dtype=np.float32)
-        
-        # Detectar canais
-        if len(audio.shape) == 1:
-            num_channels = 1
-            audio = audio.reshape(1, -1)
-        else:
-            num_channels = audio.shape[0]
-        
-        logger.info(f"Áudio carregado (librosa): {audio_path.name}")
-        logger.info(f"  Sample rate: {sr} Hz")
-        logger.info(f"  Canais: {num_channels}")
-        logger.info(f"  Duração: {audio.shape[-1] / sr:.2f}s")
-        
-        return audio, sr, num_channels
-        
-    except Exception as e:
-        logger.warning(f"librosa falhou: {e}")
+    if backend == 'soundfile':
+        import soundfile as sf
+        try:
+            resultado = _carregar_soundfile(audio_path)
+        except sf.LibsndfileError as e:
+            logger.warning(f"soundfile falhou: {e}")
+            backend = 'ffmpeg'
     
-    # Tentativa 3: Conversão via subprocess (fallback final)
-    try:
+    if resultado is None:
         import subprocess
-        import tempfile
-        
-        logger.info("Tentando conversão via subprocess...")
-        
-        # Criar arquivo WAV temporário
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-            tmp_path = tmp.name
-        
-        # Converter usando sox (se disponível) ou ffmpeg
         try:
-            # Tentar sox primeiro (mais rápido)
-            cmd = ['sox', str(audio_path), tmp_path]
-            subprocess.run(cmd, capture_output=True, check=True, timeout=300)
-            logger.info("Conversão via sox bem-sucedida")
-        except:
-            # Fallback para ffmpeg
-            cmd = [
-                'ffmpeg', '-i', str(audio_path),
-                '-acodec', 'pcm_s16le',
-                '-y', tmp_path
-            ]
-            subprocess.run(cmd, capture_output=True, check=True, timeout=300)
-            logger.info("Conversão via ffmpeg bem-sucedida")
-        
-        # Carregar arquivo convertido
-        audio, sr = librosa.load(tmp_path, sr=None, mono=False, dtype=np.float32)
-        
-        # Limpar arquivo temporário
-        Path(tmp_path).unlink()
-        
-        # Detectar canais
-        if len(audio.shape) == 1:
-            num_channels = 1
-            audio = audio.reshape(1, -1)
-        else:
-            num_channels = audio.shape[0]
-        
-        logger.info(f"Áudio carregado (subprocess): {audio_path.name}")
-        logger.info(f"  Sample rate: {sr} Hz")
-        logger.info(f"  Canais: {num_channels}")
-        logger.info(f"  Duração: {audio.shape[-1] / sr:.2f}s")
-        
-        return audio, sr, num_channels
+            resultado = _carregar_ffmpeg(audio_path)
+        except (OSError, subprocess.SubprocessError, ValueError, KeyError, IndexError) as e:
+            logger.warning(f"ffmpeg falhou: {e}")
+            backend = 'librosa'
+    
+    if resultado is None:
+        try:
+            resultado = _carregar_librosa(audio_path)
+        except Exception as e:
+            logger.error(f"Todas as tentativas falharam para {audio_path}: {e}")
+            raise RuntimeError(f"Não foi possível carregar o áudio: {e}")
+    
+    audio, sr, num_channels = resultado
+    logger.info(f"Áudio carregado ({backend}): {audio_path.name}")
+    logger.info(f"  Sample rate: {sr} Hz")
+    logger.info(f"  Canais: {num_channels}")
+    logger.info(f"  Duração: {audio.shape[-1] / sr:.2f}s")
+    
+    return audio, sr, num_channels
+
+
+def carregar_trecho_central(audio_path: Path, duracao_s: float) -> Optional[Tuple[np.ndarray, int, int, float]]:
+    """
+    Lê do disco apenas o trecho central usado na análise espectral (via soundfile)
+    Evita decodificar o arquivo inteiro quando nenhum gráfico será gerado
+    
+    Args:
+        audio_path: Caminho do arquivo de áudio
+        duracao_s: Duração do trecho central em segundos
         
-    except Exception as e:
-        logger.error(f"Todas as tentativas falharam para {audio_path}: {e}")
-        raise RuntimeError(f"Não foi possível carregar o áudio: {e}")
+    Returns:
+        Tuple (audio_data, sample_rate, num_channels, duracao_total_s)
+        ou None se o soundfile não suportar o arquivo
+    """
+    if _BACKEND_POR_EXTENSAO.get(audio_path.suffix.lower(), 'ffmpeg') != 'soundfile':
+        return None
+    
+    import soundfile as sf
+    
+    try:
+        info = sf.info(str(audio_path))
+        sr = info.samplerate
+        frames = min(info.frames, int(sr * duracao_s))
+        inicio = (info.frames - frames) // 2
+        audio, _ = sf.read(str(audio_path), start=inicio, frames=frames,
+                           dtype='float32', always_2d=True)
+    except sf.LibsndfileError as e:
+        logger.warning(f"Leitura parcial (soundfile) indisponível: {e}")
+        return None
+    
+    logger.info(f"Trecho central carregado (soundfile): {audio_path.name}")
+    logger.info(f"  Sample rate: {sr} Hz")
+    logger.info(f"  Canais: {info.channels}")
+    logger.info(f"  Duração total: {info.frames / sr:.2f}s (analisados {frames / sr:.2f}s)")
+    
+    return audio.T, sr, info.channels, info.frames / sr
+
+
+@lru_cache(maxsize=8)
+def _frequencias_rfft(n_fft: int, sr: int) -> np.ndarray:
+    """
+    Eixo de frequências da rfft, memoizado por (n_fft, sr)
+    Em lote, arquivos com o mesmo sample rate e duração de amostra compartilham o array
+    (o pocketfft do scipy já mantém seu próprio cache de planos para o mesmo n_fft)
+    """
+    from scipy.fft import rfftfreq
+    freqs = rfftfreq(n_fft, 1/sr)
+    freqs.flags.writeable = False  # Compartilhado entre chamadas
+    return freqs
+
+
+@lru_cache(maxsize=8)
+def _indices_bandas(n_fft: int, sr: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Índices das bandas de BANDAS_ENERGIA no eixo da rfft, memoizados por (n_fft, sr)
+    
+    Returns:
+        Tuple (pares (início, fim) intercalados para o reduceat, contagem de bins por banda)
+    """
+    freqs = _frequencias_rfft(n_fft, sr)
+    faixas = np.array(list(BANDAS_ENERGIA.values()), dtype=np.float64)
+    inicio = np.searchsorted(freqs, faixas[:, 0], side='left')
+    fim = np.searchsorted(freqs, faixas[:, 1], side='right')
+    pares = np.column_stack((inicio, fim)).ravel()
+    contagens = fim - inicio
+    pares.flags.writeable = False  # Compartilhados entre chamadas
+    contagens.flags.writeable = False
+    return pares, contagens
 
 
 def detectar_sample_rate_efetivo(audio: np.ndarray, sr: int, 
@@ -177,34 +269,49 @@ def detectar_sample_rate_efetivo(audio: np.ndarray, sr: int,
     """
     # Converter para mono se stereo (média dos canais)
     if len(audio.shape) > 1:
-        audio_mono = np.mean(audio, axis=0)
+        audio_mono = np.mean(audio, axis=0, dtype=np.float32)
     else:
         audio_mono = audio
     
-    # Para arquivos muito grandes (>60s), usar amostra representativa
-    max_samples = sr * 60  # 60 segundos
+    # Para arquivos longos, usar amostra representativa na taxa nativa
+    # (reamostrar antes da FFT eliminaria justamente as frequências altas que se quer medir)
+    max_samples = int(sr * DURACAO_AMOSTRA_S)
     if len(audio_mono) > max_samples:
-        logger.info(f"Áudio longo detectado ({len(audio_mono)/sr:.0f}s), usando amostra de 60s")
+        logger.info(f"Áudio longo detectado ({len(audio_mono)/sr:.0f}s), usando amostra de {DURACAO_AMOSTRA_S}s")
         # Usar parte do meio (mais representativo)
         start_idx = len(audio_mono) // 2 - max_samples // 2
         audio_mono = audio_mono[start_idx:start_idx + max_samples]
     
-    # FFT do áudio
-    fft_result = np.fft.rfft(audio_mono)
-    freqs = np.fft.rfftfreq(len(audio_mono), 1/sr)
-    magnitude_db = 20 * np.log10(np.abs(fft_result) + 1e-10)
-    
-    # Normalizar magnitude (0 dB = pico)
-    magnitude_db = magnitude_db - np.max(magnitude_db)
+    # FFT do áudio (pocketfft do scipy, multi-thread e precisão simples)
+    from scipy.fft import rfft, next_fast_len
+    audio_mono = np.ascontiguousarray(audio_mono, dtype=np.float32)
+    n_fft = next_fast_len(len(audio_mono), real=True)  # Evita tamanhos primos (pior caso da FFT)
+    fft_result = rfft(audio_mono, n=n_fft, workers=_workers_fft)
+    freqs = _frequencias_rfft(n_fft, sr)
+    # Potência |X|² = re² + im² direto do complex64 (float32), sem a raiz do np.abs.
+    # Posição extra zerada: permite índice final == len(freqs) no reduceat
+    potencia = np.zeros(len(fft_result) + 1, dtype=np.float32)
+    espectro = potencia[:-1]
+    np.square(fft_result.real, out=espectro)
+    espectro += np.square(fft_result.imag)
+    pico = max(float(espectro.max()), 1e-20)
+    
+    # Espectro em dB (0 dB = pico) só para o plot: 10·log10 da potência ≡ 20·log10 da magnitude
+    magnitude_db = espectro + 1e-20
+    np.log10(magnitude_db, out=magnitude_db)
+    magnitude_db *= 10
+    magnitude_db -= magnitude_db.max()
     
     # Encontrar frequência de corte (onde energia cai abaixo do threshold)
-    above_threshold = magnitude_db > threshold_db
+    # Comparação no domínio linear da potência: |X|² > pico² · 10**(threshold_db/10)
+    limiar_linear = pico * 10 ** (threshold_db / 10)
+    above_threshold = espectro > limiar_linear
     
-    # Procurar último ponto acima do threshold
-    indices_above = np.where(above_threshold)[0]
+    # Último ponto acima do threshold: argmax na visão invertida (sem np.where)
+    ultimo_reverso = int(np.argmax(above_threshold[::-1]))
     
-    if len(indices_above) > 0:
-        cutoff_idx = indices_above[-1]
+    if above_threshold[-1 - ultimo_reverso]:
+        cutoff_idx = len(above_threshold) - 1 - ultimo_reverso
         cutoff_freq = freqs[cutoff_idx]
     else:
         cutoff_freq = 0
@@ -212,21 +319,17 @@ def detectar_sample_rate_efetivo(audio: np.ndarray, sr: int,
     # Estimar sample rate efetivo (Nyquist: freq_max * 2)
     effective_sr = cutoff_freq * 2
     
-    # Calcular energia por bandas
-    bandas = {
-        '0-8kHz': (0, 8000),
-        '8-16kHz': (8000, 16000),
-        '16-24kHz': (16000, 24000)
-    }
+    # Potência normalizada pelo pico (equivale a 10**(magnitude_db/10))
+    potencia /= pico
     
-    energia_bandas = {}
-    for nome_banda, (f_min, f_max) in bandas.items():
-        mask = (freqs >= f_min) & (freqs <= f_max)
-        if np.any(mask):
-            energia = np.mean(10 ** (magnitude_db[mask] / 10))
-            energia_bandas[nome_banda] = float(energia)
-        else:
-            energia_bandas[nome_banda] = 0.0
+    # Uma única passada: reduceat em (início, fim) intercalados, pares = somas das bandas
+    pares, contagens = _indices_bandas(n_fft, sr)
+    somas = np.add.reduceat(potencia, pares)[::2]
+    
+    energia_bandas = {
+        nome_banda: float(soma / contagem) if contagem > 0 else 0.0
+        for nome_banda, soma, contagem in zip(BANDAS_ENERGIA, somas, contagens)
+    }
     
     # Determinar status
     tolerancia = 0.9  # 90% do SR declarado
@@ -251,6 +354,49 @@ def detectar_sample_rate_efetivo(audio: np.ndarray, sr: int,
     }
 
 
+@lru_cache(maxsize=None)
+def _pyplot():
+    """
+    Importa pyplot sob demanda, uma única vez por processo
+    Sem janelas na tela (SHOW_PLOTS = False) usa o backend Agg, que só rasteriza para arquivo
+    Só é chamado com SAVE_PLOTS ou SHOW_PLOTS: sem gráficos, matplotlib nunca é carregado
+    """
+    import matplotlib
+    if not SHOW_PLOTS:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _espectrograma_db(canal: np.ndarray) -> np.ndarray:
+    """
+    STFT em complex64 com janela pré-calculada, convertida para dB relativo ao pico
+    Equivalente a librosa.amplitude_to_db(np.abs(D), ref=np.max) (amin=1e-5, top_db=80)
+    
+    Args:
+        canal: Áudio de um canal
+        
+    Returns:
+        Matriz (freqs, frames) em dB, float32
+    """
+    import librosa
+    
+    D = librosa.stft(
+        np.ascontiguousarray(canal),  # Copia só este canal se vier de uma visão transposta
+        n_fft=N_FFT_ESPECTROGRAMA,
+        hop_length=HOP_ESPECTROGRAMA,
+        window=_JANELA_STFT,
+        dtype=np.complex64
+    )
+    S_db = np.abs(D)
+    np.maximum(S_db, 1e-5, out=S_db)
+    np.log10(S_db, out=S_db)
+    S_db *= 20
+    S_db -= S_db.max()
+    np.maximum(S_db, -80.0, out=S_db)
+    return S_db
+
+
 def gerar_espectrograma(audio: np.ndarray, sr: int, output_path: Path):
     """
     Gera espectrograma visual (similar ao Audacity)
@@ -260,7 +406,11 @@ def gerar_espectrograma(audio: np.ndarray, sr: int, output_path: Path):
         sr: Sample rate
         output_path: Caminho para salvar PNG
     """
-    plt.figure(figsize=(14, 8))
+    import librosa.display
+    plt = _pyplot()
+    
+    # Figura persistente: reutilizada (limpa) a cada arquivo em vez de recriada
+    plt.figure(num='espectrograma', figsize=(14, 8), clear=True)
     
     # Se stereo, plotar ambos os canais
     if len(audio.shape) > 1:
@@ -270,8 +420,7 @@ def gerar_espectrograma(audio: np.ndarray, sr: int, output_path: Path):
             plt.subplot(num_channels, 1, i + 1)
             
             # Calcular espectrograma
-            D = librosa.stft(audio[i])
-            S_db = librosa.amplitude_to_db(np.abs(D), ref=np.max)
+            S_db = _espectrograma_db(audio[i])
             
             # Plot
             librosa.display.specshow(
@@ -290,8 +439,7 @@ def gerar_espectrograma(audio: np.ndarray, sr: int, output_path: Path):
                 plt.xlabel('Tempo (s)')
     else:
         # Mono
-        D = librosa.stft(audio)
-        S_db = librosa.amplitude_to_db(np.abs(D), ref=np.max)
+        S_db = _espectrograma_db(audio)
         
         librosa.display.specshow(
             S_db, 
@@ -309,7 +457,7 @@ def gerar_espectrograma(audio: np.ndarray, sr: int, output_path: Path):
     plt.tight_layout()
     
     if SAVE_PLOTS:
-        plt.savefig(output_path, dpi=DPI, bbox_inches='tight')
+        plt.savefig(output_path, dpi=DPI)
         logger.info(f"  Espectrograma salvo: {output_path.name}")
     
     if SHOW_PLOTS and not PAUSE_BETWEEN_FILES:
@@ -317,9 +465,6 @@ def gerar_espectrograma(audio: np.ndarray, sr: int, output_path: Path):
         plt.pause(0.1)
     elif SHOW_PLOTS and PAUSE_BETWEEN_FILES:
         plt.show()
-    
-    if not PAUSE_BETWEEN_FILES:
-        plt.close()
 
 
 def gerar_plot_espectro(analise: Dict, output_path: Path):
@@ -330,14 +475,22 @@ def gerar_plot_espectro(analise: Dict, output_path: Path):
         analise: Dicionário com análise espectral
         output_path: Caminho para salvar PNG
     """
-    plt.figure(figsize=(12, 6))
+    plt = _pyplot()
+    
+    # Figura persistente: reutilizada (limpa) a cada arquivo em vez de recriada
+    plt.figure(num='espectro_frequencia', figsize=(12, 6), clear=True)
     
     freqs = analise['freqs']
     magnitude_db = analise['magnitude_db']
     cutoff_freq = analise['frequencia_corte_hz']
     
-    # Plot espectro
-    plt.plot(freqs / 1000, magnitude_db, linewidth=0.5, alpha=0.7)
+    # Plot espectro: envoltória (máximo por bloco) com no máximo PONTOS_PLOT_ESPECTRO pontos.
+    # Milhões de segmentos de linha não são visíveis na imagem e dominam o tempo de rasterização
+    passo = max(1, len(magnitude_db) // PONTOS_PLOT_ESPECTRO)
+    n_blocos = len(magnitude_db) // passo
+    magnitude_plot = magnitude_db[:n_blocos * passo].reshape(n_blocos, passo).max(axis=1)
+    freqs_plot = freqs[:n_blocos * passo:passo]
+    plt.plot(freqs_plot / 1000, magnitude_plot, linewidth=0.5, alpha=0.7)
     
     # Linha de corte
     plt.axvline(cutoff_freq / 1000, color='red', linestyle='--', 
@@ -358,7 +511,7 @@ def gerar_plot_espectro(analise: Dict, output_path: Path):
     plt.tight_layout()
     
     if SAVE_PLOTS:
-        plt.savefig(output_path, dpi=DPI, bbox_inches='tight')
+        plt.savefig(output_path, dpi=DPI)
         logger.info(f"  Espectro salvo: {output_path.name}")
     
     if SHOW_PLOTS and not PAUSE_BETWEEN_FILES:
@@ -366,9 +519,6 @@ def gerar_plot_espectro(analise: Dict, output_path: Path):
         plt.pause(0.1)
     elif SHOW_PLOTS and PAUSE_BETWEEN_FILES:
         plt.show()
-    
-    if not PAUSE_BETWEEN_FILES:
-        plt.close()
 
 
 def gerar_plot_bandas(analise: Dict, output_path: Path):
@@ -379,7 +529,10 @@ def gerar_plot_bandas(analise: Dict, output_path: Path):
         analise: Dicionário com análise espectral
         output_path: Caminho para salvar PNG
     """
-    plt.figure(figsize=(10, 6))
+    plt = _pyplot()
+    
+    # Figura persistente: reutilizada (limpa) a cada arquivo em vez de recriada
+    plt.figure(num='analise_bandas', figsize=(10, 6), clear=True)
     
     bandas = list(analise['energia_por_banda'].keys())
     energias = list(analise['energia_por_banda'].values())
@@ -420,7 +573,7 @@ def gerar_plot_bandas(analise: Dict, output_path: Path):
     plt.tight_layout()
     
     if SAVE_PLOTS:
-        plt.savefig(output_path, dpi=DPI, bbox_inches='tight')
+        plt.savefig(output_path, dpi=DPI)
         logger.info(f"  Análise de bandas salva: {output_path.name}")
     
     if SHOW_PLOTS and not PAUSE_BETWEEN_FILES:
@@ -428,9 +581,6 @@ def gerar_plot_bandas(analise: Dict, output_path: Path):
         plt.pause(0.1)
     elif SHOW_PLOTS and PAUSE_BETWEEN_FILES:
         plt.show()
-    
-    if not PAUSE_BETWEEN_FILES:
-        plt.close()
 
 
 def analisar_audio(audio_path: Path, output_dir: Path) -> Dict:
@@ -451,8 +601,16 @@ def analisar_audio(audio_path: Path, output_dir: Path) -> Dict:
     # Criar pasta de output
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Carregar áudio
-    audio, sr, num_channels = carregar_audio(audio_path)
+    # Carregar áudio: o espectrograma precisa do arquivo inteiro; sem gráficos
+    # basta o trecho central usado pela análise espectral
+    gerar_graficos = SAVE_PLOTS or SHOW_PLOTS
+    trecho = None if gerar_graficos else carregar_trecho_central(audio_path, DURACAO_AMOSTRA_S)
+    
+    if trecho is not None:
+        audio, sr, num_channels, duracao = trecho
+    else:
+        audio, sr, num_channels = carregar_audio(audio_path)
+        duracao = audio.shape[-1] / sr
     
     # Análise espectral
     logger.info("Detectando sample rate efetivo...")
@@ -461,25 +619,26 @@ def analisar_audio(audio_path: Path, output_dir: Path) -> Dict:
     # Adicionar informações extras
     analise['arquivo'] = audio_path.name
     analise['canais'] = num_channels
-    analise['duracao_segundos'] = float(len(audio.T) / sr)
+    analise['duracao_segundos'] = float(duracao)
     
     # Gerar gráficos
-    logger.info("Gerando visualizações...")
-    
-    gerar_espectrograma(
-        audio, sr, 
-        output_dir / 'espectrograma.png'
-    )
-    
-    gerar_plot_espectro(
-        analise,
-        output_dir / 'espectro_frequencia.png'
-    )
-    
-    gerar_plot_bandas(
-        analise,
-        output_dir / 'analise_bandas.png'
-    )
+    if gerar_graficos:
+        logger.info("Gerando visualizações...")
+        
+        gerar_espectrograma(
+            audio, sr, 
+            output_dir / 'espectrograma.png'
+        )
+        
+        gerar_plot_espectro(
+            analise,
+            output_dir / 'espectro_frequencia.png'
+        )
+        
+        gerar_plot_bandas(
+            analise,
+            output_dir / 'analise_bandas.png'
+        )
     
     # Remover dados de plot do JSON (muito grandes)
     analise_json = {k: v for k, v in analise.items() 
@@ -503,54 +662,116 @@ def analisar_audio(audio_path: Path, output_dir: Path) -> Dict:
     return analise_json
 
 
-def processar_pasta(input_dir: Path, output_dir: Path) -> List[Dict]:
+def _registrar_resultado(resultado: Dict, arquivo_jsonl, estatisticas: Dict[str, int]):
+    """
+    Grava o resultado de um áudio como uma linha JSON e atualiza os contadores
+    
+    Args:
+        resultado: Resultado de analisar_audio
+        arquivo_jsonl: Arquivo resultados.jsonl aberto para escrita
+        estatisticas: Contadores por status (atualizados no lugar)
+    """
+    arquivo_jsonl.write(json.dumps(resultado, ensure_ascii=False) + '\n')
+    arquivo_jsonl.flush()
+    estatisticas[resultado['status']] += 1
+
+
+def _processar_sequencial(audio_files: List[Path], output_dir: Path,
+                          arquivo_jsonl, estatisticas: Dict[str, int]):
+    """
+    Processa os áudios um a um no processo principal
+    
+    Args:
+        audio_files: Arquivos de áudio (já ordenados)
+        output_dir: Pasta de saída
+        arquivo_jsonl: Arquivo resultados.jsonl aberto para escrita
+        estatisticas: Contadores por status (atualizados no lugar)
+    """
+    for i, audio_path in enumerate(audio_files, 1):
+        logger.info(f"\n[{i}/{len(audio_files)}] Processando: {audio_path.name}")
+        
+        # Criar pasta de output para este áudio
+        audio_output_dir = output_dir / f"{audio_path.stem}_analise"
+        
+        try:
+            resultado = analisar_audio(audio_path, audio_output_dir)
+            _registrar_resultado(resultado, arquivo_jsonl, estatisticas)
+            
+        except Exception as e:
+            logger.error(f"Erro ao processar {audio_path.name}: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+            continue
+
+
+def _inicializar_processo():
+    """Inicializador dos processos do pool: uma thread de FFT por processo"""
+    global _workers_fft
+    _workers_fft = 1
+
+
+def processar_pasta(input_dir: Path, output_dir: Path) -> Dict[str, int]:
     """
     Processa todos os áudios de uma pasta
+    Cada resultado é gravado em resultados.jsonl assim que fica pronto (memória constante)
     
     Args:
         input_dir: Pasta com arquivos de áudio
         output_dir: Pasta de saída
         
     Returns:
-        Lista com resultados de todos os áudios
+        Contadores por status: {'real': n, 'upsampled': n}
     """
+    estatisticas = {'real': 0, 'upsampled': 0}
+    
     # Validar pasta de entrada
     if not input_dir.exists():
         logger.error(f"Pasta de entrada não encontrada: {input_dir}")
         raise FileNotFoundError(f"Pasta não encontrada: {input_dir}")
     
-    # Buscar arquivos de áudio (apenas na raiz)
-    audio_files = []
-    for formato in FORMATOS_SUPORTADOS:
-        audio_files.extend(list(input_dir.glob(f"*{formato}")))
+    # Buscar arquivos de áudio (apenas na raiz): uma única listagem, extensão sem diferenciar maiúsculas
+    extensoes = {formato.lower() for formato in FORMATOS_SUPORTADOS}
+    audio_files = [p for p in input_dir.iterdir() if p.suffix.lower() in extensoes and p.is_file()]
     
     if not audio_files:
         logger.warning(f"Nenhum arquivo de áudio encontrado em: {input_dir}")
         logger.warning(f"Formatos suportados: {FORMATOS_SUPORTADOS}")
-        return []
+        return estatisticas
     
     logger.info(f"\nEncontrados {len(audio_files)} arquivos de áudio")
     
-    # Processar cada arquivo
-    resultados = []
+    audio_files = sorted(audio_files)
+    num_processos = NUM_PROCESSOS or os.cpu_count() or 1
     
-    for i, audio_path in enumerate(sorted(audio_files), 1):
-        logger.info(f"\n[{i}/{len(audio_files)}] Processando: {audio_path.name}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / 'resultados.jsonl', 'w', encoding='utf-8') as arquivo_jsonl:
+        if SHOW_PLOTS or num_processos == 1 or len(audio_files) == 1:
+            _processar_sequencial(audio_files, output_dir, arquivo_jsonl, estatisticas)
+            return estatisticas
         
-        # Criar pasta de output para este áudio
-        audio_output_dir = output_dir / f"{audio_path.stem}_analise"
+        # Processar arquivos em paralelo (análises independentes e CPU-bound)
+        num_processos = min(num_processos, len(audio_files))
+        logger.info(f"Processando em paralelo com {num_processos} processos")
         
-        try:
-            resultado = analisar_audio(audio_path, audio_output_dir)
-            resultados.append(resultado)
+        with ProcessPoolExecutor(max_workers=num_processos, initializer=_inicializar_processo) as executor:
+            futures = {
+                executor.submit(analisar_audio, audio_path, output_dir / f"{audio_path.stem}_analise"): audio_path
+                for audio_path in audio_files
+            }
             
-        except Exception as e:
-            logger.error(f"Erro ao processar {audio_path.name}: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            continue
-    
-    return resultados
+            # Linhas gravadas na ordem de conclusão (cada uma identifica seu 'arquivo')
+            for concluidos, future in enumerate(as_completed(futures), 1):
+                audio_path = futures[future]
+                try:
+                    _registrar_resultado(future.result(), arquivo_jsonl, estatisticas)
+                    logger.info(f"[{concluidos}/{len(audio_files)}] Concluído: {audio_path.name}")
+                except Exception as e:
+                    # Inclui o traceback remoto do processo (encadeado como causa da exceção)
+                    logger.error(f"Erro ao processar {audio_path.name}: {e}")
+                    import traceback
+                    logger.error(traceback.format_exc())
+    
+    return estatisticas
 
 
 def main():
@@ -573,42 +794,36 @@ def main():
     # Processar
     inicio = datetime.now()
     
-    resultados = processar_pasta(input_path, output_path)
+    estatisticas = processar_pasta(input_path, output_path)
+    total = sum(estatisticas.values())
     
     fim = datetime.now()
     tempo_total = (fim - inicio).total_seconds()
     
     # Resumo geral
-    if resultados:
+    if total:
         logger.info(f"\n{'='*60}")
         logger.info("RESUMO GERAL")
         logger.info(f"{'='*60}")
-        logger.info(f"Total processado: {len(resultados)} áudios")
+        logger.info(f"Total processado: {total} áudios")
         logger.info(f"Tempo total: {tempo_total:.2f}s")
         
-        # Estatísticas
-        upsampled = sum(1 for r in resultados if r['status'] == 'upsampled')
-        real = len(resultados) - upsampled
-        
         logger.info(f"\nStatus:")
-        logger.info(f"  Real: {real}")
-        logger.info(f"  Upsampled: {upsampled}")
+        logger.info(f"  Real: {estatisticas['real']}")
+        logger.info(f"  Upsampled: {estatisticas['upsampled']}")
         
-        # Salvar resumo geral
+        # Salvar resumo geral (só estatísticas; resultados por áudio em resultados.jsonl)
         resumo_path = output_path / 'resumo_geral.json'
         resumo = {
             'data_analise': inicio.isoformat(),
-            'total_arquivos': len(resultados),
+            'total_arquivos': total,
             'tempo_processamento_s': tempo_total,
             'configuracao': {
                 'threshold_db': ENERGY_THRESHOLD_DB,
                 'formatos': FORMATOS_SUPORTADOS
             },
-            'estatisticas': {
-                'real': real,
-                'upsampled': upsampled
-            },
-            'resultados': resultados
+            'estatisticas': estatisticas,
+            'resultados': 'resultados.jsonl'
         }
         
         with open(resumo_path, 'w', encoding='utf-8') as f:
@@ -626,7 +841,7 @@ def main():
     
     # Manter janelas abertas se configurado
     if SHOW_PLOTS and PAUSE_BETWEEN_FILES:
-        plt.show()
+        _pyplot().show()
 
 
 if __name__ == "__main__":
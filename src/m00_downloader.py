@@ -6,20 +6,51 @@ Módulo 00 - Downloader de Áudios do YouTube
 Realiza download de áudios e legendas em português do YouTube
 """
 
+import os
 import sys
 import csv
+import atexit
 import time
-import random
 import logging
+import queue
 import shutil
 import json
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Set, TextIO, Tuple
 
 # Adiciona o diretório raiz ao path para importar config
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config import DOWNLOADER, PROJECT_ROOT
+from config import (
+    DOWNLOADER,
+    PROJECT_ROOT,
+    LIMITE_POR_FONTE,
+    AUDIO_FORMATO,
+    AUDIO_BITRATE_KBPS,
+    AUDIO_SAMPLE_RATE_HZ,
+    AUDIO_FRAGMENTOS_SIMULTANEOS,
+    DURACAO_MIN_SEGUNDOS,
+    DURACAO_MAX_SEGUNDOS,
+    DATA_UPLOAD_MINIMA,
+    DATA_UPLOAD_MAXIMA,
+    DATA_UPLOAD_MIN_AAAAMMDD,
+    DATA_UPLOAD_MAX_AAAAMMDD,
+    SORTEAR_DELAY_CSV,
+    SORTEAR_DELAY_PLAYLIST,
+    REDE_TIMEOUT_SEGUNDOS,
+    REDE_TENTATIVAS,
+    REDE_PAUSA_HTTP_429_SEGUNDOS,
+    VIDEOS_SIMULTANEOS,
+    CACHE_CONSULTAR,
+    CACHE_SEM_LEGENDAS_DIAS,
+    DOWNLOADER_SOBRESCREVER,
+    PRIORIDADE_LEGENDAS,
+    IDIOMAS_LEGENDAS,
+)
 
 try:
     import yt_dlp
@@ -42,20 +73,30 @@ def configurar_logging() -> None:
     
     arquivo_log = pasta_logs / 'output.log'
     
+    # Campos de thread/processo não são usados no formato: evita coletá-los a cada registro
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Remove handlers existentes
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
     
-    # Configura novo logging (modo 'w' sobrescreve)
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s | %(levelname)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        handlers=[
-            logging.FileHandler(arquivo_log, mode='w', encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Handlers reais (modo 'w' sobrescreve), alimentados por uma única thread de escrita
+    formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    handler_arquivo = logging.FileHandler(arquivo_log, mode='w', encoding='utf-8')
+    handler_console = logging.StreamHandler(sys.stdout)
+    handler_arquivo.setFormatter(formatter)
+    handler_console.setFormatter(formatter)
+    
+    # As threads de download só enfileiram os registros: o I/O de log sai do caminho crítico
+    fila_logs = queue.SimpleQueue()
+    listener = QueueListener(fila_logs, handler_arquivo, handler_console)
+    listener.start()
+    atexit.register(listener.stop)  # Esvazia a fila antes de encerrar
+    
+    logging.root.addHandler(QueueHandler(fila_logs))
+    logging.root.setLevel(logging.INFO)
     
     logging.info("="*70)
     logging.info("INICIANDO MÓDULO DOWNLOADER")
@@ -121,68 +162,100 @@ def validar_ambiente() -> bool:
 # MANIPULAÇÃO DE CSV
 # ============================================================================
 
-def ler_links_csv() -> List[str]:
+# Buffer de leitura de 1 MiB: listas grandes de links são lidas em poucas chamadas read()
+BUFFER_LEITURA = 1 << 20
+
+
+def carregar_urls_processadas() -> Set[str]:
     """
-    Lê todos os links do arquivo CSV
-    Retorna lista de URLs
+    Lê os logs de sucesso e rejeição (append-only) uma única vez
+    Retorna conjunto de URLs já processadas em execuções anteriores
     """
-    csv_path = PROJECT_ROOT / 'arquivos' / 'links_download' / 'links.csv'
-    links = []
+    pasta_links = PROJECT_ROOT / 'arquivos' / 'links_download'
+    processadas = set()
     
-    try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                url = row.get('url_link', '').strip()
-                if url:
-                    links.append(url)
-    except Exception as e:
-        logging.error(f"Erro ao ler CSV: {e}")
+    for nome_log in ('download_sucesso.txt', 'download_rejeitado.txt'):
+        try:
+            with open(pasta_links / nome_log, 'r', encoding='utf-8', buffering=BUFFER_LEITURA) as f:
+                for linha in f:
+                    # Rejeitados: "url | motivo"
+                    url = linha.split(' | ', 1)[0].strip()
+                    if url:
+                        processadas.add(url)
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logging.error(f"Erro ao ler {nome_log}: {e}")
     
-    return links
+    return processadas
 
 
-def remover_linha_csv(url_removida: str) -> None:
+def ler_links_csv() -> List[str]:
     """
-    Remove uma linha específica do CSV e sobrescreve o arquivo
+    Lê os links do arquivo CSV (que nunca é reescrito)
+    Retorna lista de URLs ainda não registradas em sucesso/rejeitado
     """
     csv_path = PROJECT_ROOT / 'arquivos' / 'links_download' / 'links.csv'
+    processadas = carregar_urls_processadas()
+    links = []
+    ignorados = 0
     
     try:
-        # Lê todas as linhas
-        linhas = []
-        with open(csv_path, 'r', encoding='utf-8') as f:
+        # newline='' conforme o módulo csv (campos entre aspas com quebra de linha)
+        with open(csv_path, 'r', encoding='utf-8', newline='', buffering=BUFFER_LEITURA) as f:
             reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames
             for row in reader:
-                if row['url_link'].strip() != url_removida:
-                    linhas.append(row)
-        
-        # Sobrescreve arquivo
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(linhas)
-        
-        logging.debug(f"Linha removida do CSV: {url_removida}")
-    
+                url = row.get('url_link', '').strip()
+                if not url:
+                    continue
+                if url in processadas:
+                    ignorados += 1
+                    continue
+                processadas.add(url)  # Duplicatas no próprio CSV também são puladas
+                links.append(url)
     except Exception as e:
-        logging.error(f"Erro ao remover linha do CSV: {e}")
+        logging.error(f"Erro ao ler CSV: {e}")
+    
+    if ignorados:
+        logging.info(f"{ignorados} link(s) já processado(s) anteriormente. Pulando...")
+    
+    return links
 
 
 # ============================================================================
 # LOGS DE SUCESSO E REJEIÇÃO
 # ============================================================================
 
+# Serializa as escritas nos logs entre as threads de download
+_LOCK_REGISTROS = threading.Lock()
+
+# Logs abertos uma única vez por execução (fechados no atexit)
+_ARQUIVOS_REGISTRO: Dict[str, TextIO] = {}
+
+
+def abrir_registro(nome_log: str) -> TextIO:
+    """
+    Retorna o handle do log de registro, abrindo-o na primeira chamada
+    Line-buffered: cada URL chega ao disco com um único write, sem open/close por registro
+    (os logs definem o que é pulado na próxima execução, então não ficam retidos em buffer)
+    Deve ser chamado com _LOCK_REGISTROS adquirido
+    """
+    arquivo = _ARQUIVOS_REGISTRO.get(nome_log)
+    if arquivo is None:
+        log_path = PROJECT_ROOT / 'arquivos' / 'links_download' / nome_log
+        arquivo = open(log_path, 'a', encoding='utf-8', buffering=1)
+        _ARQUIVOS_REGISTRO[nome_log] = arquivo
+        atexit.register(arquivo.close)
+    return arquivo
+
+
 def registrar_sucesso(url: str) -> None:
     """
     Registra URL no arquivo de downloads bem-sucedidos
     """
-    log_path = PROJECT_ROOT / 'arquivos' / 'links_download' / 'download_sucesso.txt'
-    
     try:
-        with open(log_path, 'a', encoding='utf-8') as f:
-            f.write(f"{url}\n")
+        with _LOCK_REGISTROS:
+            abrir_registro('download_sucesso.txt').write(f"{url}\n")
         logging.info(f"Registrado em sucesso: {url}")
     except Exception as e:
         logging.error(f"Erro ao registrar sucesso: {e}")
@@ -192,37 +265,283 @@ def registrar_rejeitado(url: str, motivo: str = "") -> None:
     """
     Registra URL no arquivo de downloads rejeitados
     """
-    log_path = PROJECT_ROOT / 'arquivos' / 'links_download' / 'download_rejeitado.txt'
+    linha = f"{url}" + (f" | {motivo}" if motivo else "")
     
     try:
-        with open(log_path, 'a', encoding='utf-8') as f:
-            linha = f"{url}" + (f" | {motivo}" if motivo else "")
-            f.write(f"{linha}\n")
+        with _LOCK_REGISTROS:
+            abrir_registro('download_rejeitado.txt').write(f"{linha}\n")
         logging.warning(f"Registrado em rejeitado: {url} | {motivo}")
     except Exception as e:
         logging.error(f"Erro ao registrar rejeitado: {e}")
 
 
+# ============================================================================
+# CACHE DE VÍDEOS AVALIADOS
+# ============================================================================
+
+# Vereditos terminais gravados no cache (falhas de download não entram: são transitórias)
+VEREDITO_SUCESSO = 'sucesso'
+VEREDITO_DURACAO = 'rejeitado_duracao'
+VEREDITO_DATA = 'rejeitado_data'
+VEREDITO_SEM_LEGENDAS = 'sem_legendas'
+
+# Uma conexão SQLite por execução, compartilhada pelas threads sob lock
+_LOCK_CACHE = threading.Lock()
+_CONEXAO_CACHE: Optional[sqlite3.Connection] = None
+
+
+def abrir_cache() -> sqlite3.Connection:
+    """
+    Retorna a conexão com o cache de vídeos, criando arquivo e tabela na primeira chamada
+    Deve ser chamado com _LOCK_CACHE adquirido
+    """
+    global _CONEXAO_CACHE
+    if _CONEXAO_CACHE is None:
+        caminho = PROJECT_ROOT / 'arquivos' / 'links_download' / 'cache_videos.sqlite'
+        conexao = sqlite3.connect(str(caminho), check_same_thread=False)
+        conexao.execute('PRAGMA journal_mode=WAL')
+        conexao.execute(
+            'CREATE TABLE IF NOT EXISTS videos ('
+            'id TEXT PRIMARY KEY, duracao INTEGER, upload_date TEXT, veredito TEXT, ts INTEGER)'
+        )
+        atexit.register(conexao.close)
+        _CONEXAO_CACHE = conexao
+    return _CONEXAO_CACHE
+
+
+def gravar_cache(video_id: str, duracao: Optional[int], upload_date: Optional[str], veredito: str) -> None:
+    """
+    Grava (ou substitui) o veredito de um vídeo no cache
+    """
+    try:
+        with _LOCK_CACHE:
+            conexao = abrir_cache()
+            with conexao:
+                conexao.execute(
+                    'INSERT OR REPLACE INTO videos (id, duracao, upload_date, veredito, ts) VALUES (?, ?, ?, ?, ?)',
+                    (video_id, duracao, upload_date, veredito, int(time.time()))
+                )
+    except sqlite3.Error as e:
+        logging.error(f"Erro ao gravar cache do vídeo {video_id}: {e}")
+
+
+def motivo_rejeicao_em_cache(video_id: str) -> Optional[str]:
+    """
+    Consulta o cache e reaplica os filtros atuais aos dados guardados
+    Retorna o motivo se o vídeo continua rejeitado, ou None se deve ser processado
+    """
+    if not CACHE_CONSULTAR:
+        return None
+    
+    try:
+        with _LOCK_CACHE:
+            linha = abrir_cache().execute(
+                'SELECT duracao, upload_date, veredito, ts FROM videos WHERE id = ?', (video_id,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logging.error(f"Erro ao consultar cache do vídeo {video_id}: {e}")
+        return None
+    
+    if linha is None:
+        return None
+    duracao, upload_date, veredito, ts = linha
+    
+    # Duração e data: filtros do config atual (limites podem ter mudado desde a gravação)
+    if duracao is not None and not (DURACAO_MIN_SEGUNDOS <= duracao <= DURACAO_MAX_SEGUNDOS):
+        return f"duração fora dos limites ({duracao}s)"
+    if upload_date and upload_date.isdigit() and len(upload_date) == 8:
+        if not (DATA_UPLOAD_MIN_AAAAMMDD <= int(upload_date) <= DATA_UPLOAD_MAX_AAAAMMDD):
+            return f"data de upload fora dos limites ({upload_date})"
+    
+    # Sem legendas: só confia no veredito enquanto estiver dentro do prazo de revalidação
+    if veredito == VEREDITO_SEM_LEGENDAS and time.time() - ts < CACHE_SEM_LEGENDAS_DIAS * 86400:
+        return "sem legendas nas prioridades configuradas"
+    
+    return None
+
+
+# ============================================================================
+# CONTROLE DE TAXA (ANTI-BLOQUEIO)
+# ============================================================================
+
+# Sinalizado no Ctrl-C: as threads do pool deixam de iniciar novos vídeos
+_INTERRUPCAO = threading.Event()
+
+
+def cancelar_downloads_pendentes(executor: ThreadPoolExecutor) -> None:
+    """
+    Interrupção pelo usuário: descarta os vídeos ainda na fila do pool sem esperar por eles
+    Os downloads já em andamento terminam; nenhum novo é iniciado
+    """
+    _INTERRUPCAO.set()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LimitadorTaxa:
+    """
+    Espaça o início das requisições por intervalos aleatórios (delays do config)
+    Cada chamada a aguardar() reserva o próximo horário livre: o tempo gasto no download
+    já conta para o intervalo, e threads concorrentes dividem o mesmo ritmo agregado
+    (taxa média = 1 / delay médio) sem bloquear quem já está baixando
+    """
+    
+    def __init__(self, sortear_intervalo: Callable[[], float], descricao: str):
+        self._sortear_intervalo = sortear_intervalo
+        self._descricao = descricao
+        self._lock = threading.Lock()
+        self._proximo_inicio = 0.0  # time.monotonic() a partir do qual o próximo início é liberado
+        self._pausado_ate = 0.0  # time.monotonic() até o qual nenhum início é liberado (HTTP 429)
+    
+    def _reservar(self) -> float:
+        """
+        Reserva o próximo horário livre e retorna seu time.monotonic() (chamar com self._lock)
+        """
+        inicio = max(time.monotonic(), self._proximo_inicio)
+        self._proximo_inicio = inicio + self._sortear_intervalo()
+        return inicio
+    
+    def aguardar(self) -> bool:
+        """
+        Bloqueia a thread atual até o seu horário reservado
+        Se pausar() for chamado durante a espera, reserva um novo horário após a pausa
+        Retorna False se o processo foi interrompido (Ctrl-C) antes ou durante a espera
+        """
+        with self._lock:
+            inicio = self._reservar()
+        
+        while True:
+            espera = inicio - time.monotonic()
+            if espera > 0:
+                logging.info(f"Aguardando {espera:.2f}s antes do próximo {self._descricao}...")
+                # Event.wait em vez de time.sleep: a interrupção acorda quem está esperando
+                if _INTERRUPCAO.wait(espera):
+                    return False
+            
+            with self._lock:
+                if time.monotonic() >= self._pausado_ate:
+                    break
+                # Reserva feita antes de um HTTP 429: volta para a fila, depois da pausa
+                inicio = self._reservar()
+        
+        return not _INTERRUPCAO.is_set()
+    
+    def pausar(self, segundos: float) -> None:
+        """
+        Adia todos os próximos inícios em pelo menos `segundos` (sem bloquear quem chama)
+        Vale também para as threads que já estão em aguardar() com horário reservado
+        """
+        with self._lock:
+            self._pausado_ate = max(self._pausado_ate, time.monotonic() + segundos)
+            self._proximo_inicio = max(self._proximo_inicio, self._pausado_ate)
+
+
+# Compartilhados por toda a execução: o ritmo vale entre links e entre playlists diferentes
+LIMITADOR_LINKS = LimitadorTaxa(SORTEAR_DELAY_CSV, "link do CSV")
+LIMITADOR_VIDEOS = LimitadorTaxa(SORTEAR_DELAY_PLAYLIST, "vídeo")
+
+
+def sinalizar_bloqueio(erro: Exception) -> None:
+    """
+    Se o erro do yt-dlp for HTTP 429 (Too Many Requests), pausa links e vídeos globalmente
+    As demais threads seguem baixando o que já começaram; só os novos inícios esperam
+    """
+    mensagem = str(erro)
+    if '429' in mensagem or 'Too Many Requests' in mensagem:
+        logging.warning(f"HTTP 429 recebido: pausando novas requisições por {REDE_PAUSA_HTTP_429_SEGUNDOS:.0f}s")
+        LIMITADOR_LINKS.pausar(REDE_PAUSA_HTTP_429_SEGUNDOS)
+        LIMITADOR_VIDEOS.pausar(REDE_PAUSA_HTTP_429_SEGUNDOS)
+
+
 # ============================================================================
 # EXTRAÇÃO DE INFORMAÇÕES DO VÍDEO
 # ============================================================================
 
-def extrair_info_video(url: str) -> Optional[Dict]:
+# Instâncias YoutubeDL reaproveitadas entre vídeos: o pool de conexões HTTPS e o
+# cache do player JS sobrevivem entre chamadas. Uma por thread (YoutubeDL não é thread-safe)
+_YDL_POR_THREAD = threading.local()
+
+
+def obter_ydl(chave: Tuple, montar_opcoes: Callable[..., Dict], *args) -> 'yt_dlp.YoutubeDL':
     """
-    Extrai informações do vídeo sem baixar
-    Retorna dicionário com metadados ou None em caso de erro
+    Retorna a instância YoutubeDL da thread atual para a chave dada, criando-a na primeira vez
+    montar_opcoes(*args) só é chamada quando a instância ainda não existe
     """
-    ydl_opts = {
+    instancias = getattr(_YDL_POR_THREAD, 'instancias', None)
+    if instancias is None:
+        instancias = _YDL_POR_THREAD.instancias = {}
+    
+    ydl = instancias.get(chave)
+    if ydl is None:
+        ydl = instancias[chave] = yt_dlp.YoutubeDL(montar_opcoes(*args))
+    return ydl
+
+
+# Opções de rede comuns a todas as instâncias YoutubeDL (timeouts e retentativas do config)
+OPCOES_REDE = {
+    'socket_timeout': REDE_TIMEOUT_SEGUNDOS,
+    'retries': REDE_TENTATIVAS,
+    'fragment_retries': REDE_TENTATIVAS,
+    'extractor_retries': min(REDE_TENTATIVAS, 3),
+}
+
+
+def opcoes_extracao() -> Dict:
+    """
+    Opções do yt-dlp para extração de informações (sem download)
+    """
+    return {
+        **OPCOES_REDE,
         'quiet': True,
         'no_warnings': True,
         'extract_flat': False,
     }
+
+
+def opcoes_extracao_flat() -> Dict:
+    """
+    Opções do yt-dlp para enumerar um link do CSV
+    Playlists/canais retornam apenas id/título de cada entrada (sem resolver vídeo a vídeo);
+    um vídeo individual continua retornando as informações completas
+    """
+    ydl_opts = {
+        **OPCOES_REDE,
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': 'in_playlist',
+        'skip_download': True,
+    }
+    
+    # Com limite por fonte, nem pagina além das N primeiras entradas
+    if LIMITE_POR_FONTE > 0:
+        ydl_opts['playlistend'] = LIMITE_POR_FONTE
     
+    return ydl_opts
+
+
+def extrair_lista_flat(url: str) -> Optional[Dict]:
+    """
+    Extrai informações de um link do CSV sem resolver as entradas de playlists/canais
+    Retorna dicionário com metadados ou None em caso de erro
+    """
+    try:
+        ydl = obter_ydl(('extracao_flat',), opcoes_extracao_flat)
+        return ydl.extract_info(url, download=False)
+    except Exception as e:
+        sinalizar_bloqueio(e)
+        logging.error(f"Erro ao extrair informações de {url}: {e}")
+        return None
+
+
+def extrair_info_video(url: str) -> Optional[Dict]:
+    """
+    Extrai informações do vídeo sem baixar
+    Retorna dicionário com metadados ou None em caso de erro
+    """
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            return info
+        ydl = obter_ydl(('extracao',), opcoes_extracao)
+        return ydl.extract_info(url, download=False)
     except Exception as e:
+        sinalizar_bloqueio(e)
         logging.error(f"Erro ao extrair informações de {url}: {e}")
         return None
 
@@ -245,8 +564,8 @@ def filtrar_por_duracao(duracao_segundos: int) -> bool:
     Verifica se vídeo está dentro dos limites de duração configurados
     Retorna True se está dentro dos limites, False caso contrário
     """
-    min_dur = DOWNLOADER['filtros']['duracao']['minima_segundos']
-    max_dur = DOWNLOADER['filtros']['duracao']['maxima_segundos']
+    min_dur = DURACAO_MIN_SEGUNDOS
+    max_dur = DURACAO_MAX_SEGUNDOS
     
     if duracao_segundos < min_dur:
         logging.warning(f"Vídeo muito curto: {duracao_segundos}s (mínimo: {min_dur}s)")
@@ -259,247 +578,170 @@ def filtrar_por_duracao(duracao_segundos: int) -> bool:
     return True
 
 
-def validar_formato_data(data_str: str) -> bool:
-    """
-    Valida se string está no formato DD-MM-AAAA
-    Retorna True se válida, False caso contrário
-    """
-    if data_str == '0':
-        return True
-    
-    try:
-        dia, mes, ano = data_str.split('-')
-        dia, mes, ano = int(dia), int(mes), int(ano)
-        
-        # Valida ranges
-        if not (1 <= dia <= 31):
-            return False
-        if not (1 <= mes <= 12):
-            return False
-        if not (1900 <= ano <= 2100):
-            return False
-        
-        # Valida data real (ex: 31-02-2024 é inválido)
-        from datetime import datetime
-        datetime(ano, mes, dia)
-        
-        return True
-    except:
-        return False
-
-
-def converter_data_para_comparacao(data_str: str) -> Optional[int]:
-    """
-    Converte data DD-MM-AAAA para formato comparável (AAAAMMDD)
-    Retorna inteiro ou None se inválida
-    '0' retorna None (sem filtro)
-    """
-    if data_str == '0':
-        return None
-    
-    try:
-        dia, mes, ano = data_str.split('-')
-        # Converte para AAAAMMDD como inteiro para comparação
-        return int(f"{ano}{mes.zfill(2)}{dia.zfill(2)}")
-    except:
-        return None
-
-
 def filtrar_por_data_upload(upload_date: Optional[str]) -> Tuple[bool, str]:
     """
     Verifica se vídeo está dentro dos limites de data de upload
     Retorna (passou_filtro: bool, motivo_rejeicao: str)
+    As datas de corte são validadas e convertidas para AAAAMMDD inteiro uma única vez no config
     """
-    data_min_str = DOWNLOADER['filtros']['data_upload']['minima']
-    data_max_str = DOWNLOADER['filtros']['data_upload']['maxima']
-    
-    # Valida formato das datas configuradas
-    if not validar_formato_data(data_min_str):
-        logging.error(f"Data mínima inválida no config: '{data_min_str}' (formato: DD-MM-AAAA)")
-        sys.exit(1)
-    
-    if not validar_formato_data(data_max_str):
-        logging.error(f"Data máxima inválida no config: '{data_max_str}' (formato: DD-MM-AAAA)")
-        sys.exit(1)
-    
-    # Converte datas para comparação
-    data_min = converter_data_para_comparacao(data_min_str)
-    data_max = converter_data_para_comparacao(data_max_str)
-    
     # Se vídeo não tem data de upload
     if not upload_date:
         logging.warning("Vídeo sem data de upload (vídeo muito antigo ou metadata incompleta)")
         return True, ""  # Permite continuar
     
-    # Converte data do vídeo (formato AAAAMMDD do YouTube)
-    try:
-        video_date = int(upload_date)
-    except:
+    # Data do vídeo (AAAAMMDD do YouTube) comparada como inteiro: ordem numérica = ordem cronológica
+    if len(upload_date) != 8 or not upload_date.isdigit():
         logging.error(f"Data de upload do vídeo em formato inválido: {upload_date}")
         return True, ""  # Permite continuar em caso de erro
+    video_data = int(upload_date)
     
     # Aplica filtro mínimo
-    if data_min and video_date < data_min:
-        return False, f"Data de upload muito antiga: {upload_date} < {data_min_str}"
+    if video_data < DATA_UPLOAD_MIN_AAAAMMDD:
+        return False, f"Data de upload muito antiga: {upload_date} < {DATA_UPLOAD_MINIMA}"
     
     # Aplica filtro máximo
-    if data_max and video_date > data_max:
-        return False, f"Data de upload muito recente: {upload_date} > {data_max_str}"
+    if video_data > DATA_UPLOAD_MAX_AAAAMMDD:
+        return False, f"Data de upload muito recente: {upload_date} > {DATA_UPLOAD_MAXIMA}"
     
     return True, ""
 
 
 # ============================================================================
-# DOWNLOAD DE LEGENDAS
+# SELEÇÃO DE LEGENDAS
 # ============================================================================
 
-def verificar_e_baixar_legendas(video_id: str, info: Dict, pasta_output: Path) -> Tuple[bool, Dict]:
+def selecionar_legenda(video_id: str, info: Dict) -> Optional[Tuple[str, bool]]:
     """
-    Verifica disponibilidade e baixa legendas conforme prioridades configuradas
-    Retorna (sucesso: bool, info_legenda: Dict)
-    info_legenda contém: {'tipo': 'manual'|'auto', 'idioma': 'pt-BR', 'formato': 'vtt'}
+    Escolhe a legenda conforme prioridades configuradas, a partir das informações já extraídas
+    Retorna (idioma, is_auto) da primeira prioridade disponível ou None
     """
-    prioridades = DOWNLOADER['legendas']['prioridade']
-    
-    if not prioridades:
+    if not PRIORIDADE_LEGENDAS:
         logging.warning("Lista de prioridades de legendas está vazia!")
-        return False, {}
+        return None
     
-    subtitles = info.get('subtitles', {})
-    auto_captions = info.get('automatic_captions', {})
+    subtitles = info.get('subtitles') or {}
+    auto_captions = info.get('automatic_captions') or {}
     
     logging.info(f"Verificando legendas para vídeo {video_id}...")
     logging.debug(f"Legendas manuais disponíveis: {list(subtitles.keys())}")
     logging.debug(f"Legendas automáticas disponíveis: {list(auto_captions.keys())}")
     
-    # Itera na ordem de prioridade configurada
-    for prioridade in prioridades:
-        try:
-            # Parse do formato 'idioma-tipo' (ex: 'pt-BR-manual')
-            partes = prioridade.rsplit('-', 1)
-            if len(partes) != 2:
-                logging.error(f"Formato inválido na prioridade: '{prioridade}' (esperado: 'idioma-tipo')")
-                continue
-            
-            idioma, tipo = partes
-            is_auto = (tipo == 'auto')
-            
-            # Verifica disponibilidade
-            fonte = auto_captions if is_auto else subtitles
-            
-            if idioma in fonte:
-                logging.info(f"Tentando legenda: {idioma} ({'automática' if is_auto else 'manual'})")
-                
-                formato_baixado = baixar_legenda(video_id, info['webpage_url'], idioma, is_auto, pasta_output)
-                if formato_baixado:
-                    info_legenda = {
-                        'tipo': tipo,
-                        'idioma': idioma,
-                        'formato_original': formato_baixado
-                    }
-                    return True, info_legenda
-                else:
-                    logging.warning(f"Falha ao baixar legenda {idioma} ({tipo})")
-        
-        except Exception as e:
-            logging.error(f"Erro ao processar prioridade '{prioridade}': {e}")
-            continue
+    # Nenhum idioma configurado está disponível: rejeita sem percorrer a lista
+    if IDIOMAS_LEGENDAS.isdisjoint(subtitles) and IDIOMAS_LEGENDAS.isdisjoint(auto_captions):
+        logging.warning(f"Nenhuma legenda encontrada nas prioridades configuradas")
+        return None
+    
+    # Itera na ordem de prioridade configurada (já decomposta no config)
+    for idioma, is_auto in PRIORIDADE_LEGENDAS:
+        fonte = auto_captions if is_auto else subtitles
+        if idioma in fonte:
+            logging.info(f"Legenda selecionada: {idioma} ({'automática' if is_auto else 'manual'})")
+            return idioma, is_auto
     
     logging.warning(f"Nenhuma legenda encontrada nas prioridades configuradas")
-    return False, {}
+    return None
 
 
-def baixar_legenda(video_id: str, url: str, idioma: str, is_auto: bool, pasta_output: Path) -> Optional[str]:
+def salvar_legenda(resultado: Dict, video_id: str, idioma: str, is_auto: bool, pasta_output: Path) -> Optional[str]:
     """
-    Baixa legenda específica
-    Retorna formato da legenda baixada ('vtt', 'srv3', 'srt') ou None se falhar
+    Renomeia a legenda baixada pelo yt-dlp para {tipo}_{video_id}.txt
+    O caminho e o formato vêm de resultado['requested_subtitles'] (sem sondar extensões no disco)
+    Retorna formato da legenda baixada ('vtt', 'srv3', 'srt') ou None se não baixada
     """
     tipo = 'auto' if is_auto else 'manual'
     arquivo_legenda = pasta_output / f"{tipo}_{video_id}.txt"
     
-    ydl_opts = {
-        'skip_download': True,
-        'writesubtitles': True,
-        'writeautomaticsub': is_auto,
-        'subtitleslangs': [idioma],
-        'subtitlesformat': 'vtt/srv3/srt',  # Prioridade: vtt → srv3 → srt
-        'outtmpl': str(pasta_output / video_id),
-        'quiet': True,
-        'no_warnings': True,
-    }
-    
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
-        
-        # Procura arquivo de legenda em qualquer formato (ordem de prioridade)
-        formatos_possiveis = ['vtt', 'srv3', 'srt']
-        for extensao in formatos_possiveis:
-            arquivo_legenda_temp = pasta_output / f"{video_id}.{idioma}.{extensao}"
-            if arquivo_legenda_temp.exists():
-                arquivo_legenda_temp.rename(arquivo_legenda)
-                logging.info(f"Legenda salva (formato {extensao}): {arquivo_legenda.name}")
-                return extensao  # Retorna o formato baixado
-        
-        # Se não encontrou nenhum formato
-        logging.warning(f"Arquivo de legenda não encontrado em nenhum formato: {formatos_possiveis}")
+    legenda = (resultado.get('requested_subtitles') or {}).get(idioma) or {}
+    caminho = legenda.get('filepath')
+    if not caminho:
+        logging.warning(f"Legenda {idioma} ({tipo}) não foi baixada pelo yt-dlp")
         return None
     
-    except Exception as e:
-        logging.error(f"Erro ao baixar legenda: {e}")
-        return None
+    Path(caminho).rename(arquivo_legenda)
+    extensao = legenda.get('ext')
+    logging.info(f"Legenda salva (formato {extensao}): {arquivo_legenda.name}")
+    return extensao
 
 
 # ============================================================================
-# DOWNLOAD DE ÁUDIO
+# DOWNLOAD DE LEGENDA E ÁUDIO
 # ============================================================================
 
-def baixar_audio(video_id: str, url: str, pasta_output: Path) -> bool:
+# Downloads HTTP não fragmentados em blocos de 10 MiB (requisições Range),
+# contornando o throttling de velocidade aplicado a conexões longas
+HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+
+
+def opcoes_download(idioma: str, is_auto: bool) -> Dict:
     """
-    Baixa áudio do vídeo conforme configurações
-    Retorna True se sucesso, False caso contrário
+    Opções do yt-dlp para baixar a legenda escolhida + áudio
+    O caminho usa o template %(id)s (arquivos/audios/{video_id}/{video_id}, a mesma
+    pasta de processar_video), então uma instância serve para todos os vídeos
     """
-    formato = DOWNLOADER['audio']['formato']
-    bitrate = DOWNLOADER['audio']['bitrate_kbps']
-    sample_rate = DOWNLOADER['audio']['sample_rate_hz']
-    
-    arquivo_audio = pasta_output / f"{video_id}.{formato}"
-    
-    # Configurações base do yt-dlp
     ydl_opts = {
         'format': 'bestaudio/best',
-        'outtmpl': str(pasta_output / video_id),
+        'writesubtitles': True,
+        'writeautomaticsub': is_auto,
+        'subtitleslangs': [idioma],
+        'subtitlesformat': 'vtt/srv3/srt',  # Prioridade: vtt → srv3 → srt
+        'outtmpl': str(PROJECT_ROOT / 'arquivos' / 'audios' / '%(id)s' / '%(id)s'),
+        'concurrent_fragment_downloads': AUDIO_FRAGMENTOS_SIMULTANEOS,
+        'http_chunk_size': HTTP_CHUNK_SIZE,
+        **OPCOES_REDE,
         'quiet': False,
         'no_warnings': True,
         'postprocessors': [{
             'key': 'FFmpegExtractAudio',
-            'preferredcodec': formato,
+            'preferredcodec': AUDIO_FORMATO,
         }],
     }
     
     # Adiciona bitrate se configurado
-    if bitrate > 0:
-        ydl_opts['postprocessors'][0]['preferredquality'] = str(bitrate)
+    if AUDIO_BITRATE_KBPS > 0:
+        ydl_opts['postprocessors'][0]['preferredquality'] = str(AUDIO_BITRATE_KBPS)
     
     # Adiciona sample rate se configurado
-    if sample_rate > 0:
-        ydl_opts['postprocessor_args'] = ['-ar', str(sample_rate)]
+    if AUDIO_SAMPLE_RATE_HZ > 0:
+        ydl_opts['postprocessor_args'] = ['-ar', str(AUDIO_SAMPLE_RATE_HZ)]
     
+    return ydl_opts
+
+
+def baixar_legenda_e_audio(video_id: str, info: Dict, idioma: str, is_auto: bool,
+                           pasta_output: Path) -> Tuple[Dict, bool]:
+    """
+    Baixa legenda e áudio numa única chamada ao yt-dlp, reaproveitando as informações já extraídas
+    Retorna (info_legenda: Dict, audio_ok: bool); info_legenda vazio se a legenda não foi baixada
+    info_legenda contém: {'tipo': 'manual'|'auto', 'idioma': 'pt-BR', 'formato_original': 'vtt'}
+    """
     try:
-        logging.info(f"Iniciando download de áudio: {video_id}")
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
-        
-        if arquivo_audio.exists():
-            logging.info(f"Áudio baixado com sucesso: {arquivo_audio.name}")
-            return True
-        else:
-            logging.error(f"Arquivo de áudio não foi criado: {arquivo_audio}")
-            return False
-    
+        logging.info(f"Iniciando download de legenda e áudio: {video_id}")
+        ydl = obter_ydl(('download', idioma, is_auto), opcoes_download, idioma, is_auto)
+        # Sem nova extração: processa o dicionário já obtido em extrair_info_video
+        resultado = ydl.process_ie_result(info, download=True)
     except Exception as e:
-        logging.error(f"Erro ao baixar áudio: {e}")
-        return False
+        sinalizar_bloqueio(e)
+        logging.error(f"Erro ao baixar legenda/áudio: {e}")
+        return {}, False
+    
+    info_legenda = {}
+    formato_baixado = salvar_legenda(resultado, video_id, idioma, is_auto, pasta_output)
+    if formato_baixado:
+        info_legenda = {
+            'tipo': 'auto' if is_auto else 'manual',
+            'idioma': idioma,
+            'formato_original': formato_baixado
+        }
+    
+    # Caminho final do áudio (após FFmpegExtractAudio) informado pelo próprio yt-dlp
+    downloads = resultado.get('requested_downloads') or []
+    caminho_audio = downloads[-1].get('filepath') if downloads else None
+    if caminho_audio:
+        logging.info(f"Áudio baixado com sucesso: {Path(caminho_audio).name}")
+        return info_legenda, True
+    
+    logging.error(f"Arquivo de áudio não foi criado: {video_id}")
+    return info_legenda, False
 
 
 def criar_metadata(video_info: Dict, url_original: str, info_legenda: Dict, pasta_output: Path) -> None:
@@ -548,122 +790,213 @@ def criar_metadata(video_info: Dict, url_original: str, info_legenda: Dict, past
 # PROCESSAMENTO DE VÍDEOS
 # ============================================================================
 
+# IDs em processamento no pool: o mesmo vídeo pode aparecer em links diferentes
+# (canal e playlist) e não pode ser baixado por duas threads na mesma pasta
+_LOCK_EM_ANDAMENTO = threading.Lock()
+_VIDEOS_EM_ANDAMENTO: Set[str] = set()
+
+
+def reservar_video(video_id: str) -> bool:
+    """
+    Marca o vídeo como em processamento; False se outra thread já o reservou
+    """
+    with _LOCK_EM_ANDAMENTO:
+        if video_id in _VIDEOS_EM_ANDAMENTO:
+            return False
+        _VIDEOS_EM_ANDAMENTO.add(video_id)
+        return True
+
+
+def liberar_video(video_id: str) -> None:
+    """
+    Remove a reserva feita por reservar_video
+    """
+    with _LOCK_EM_ANDAMENTO:
+        _VIDEOS_EM_ANDAMENTO.discard(video_id)
+
+
+def remover_pasta_video(pasta: Path) -> None:
+    """
+    Remove a pasta de um vídeo rejeitado (poucos arquivos, sem subpastas)
+    Uma listagem via os.scandir + unlink por arquivo + rmdir; shutil.rmtree só se houver subpastas
+    """
+    try:
+        with os.scandir(pasta) as entradas:
+            for entrada in entradas:
+                os.unlink(entrada.path)
+        os.rmdir(pasta)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+
 def processar_video(video_info: Dict, url_original: str) -> bool:
     """
     Processa um vídeo individual: valida, baixa legenda e áudio
     Retorna True se sucesso, False caso contrário
     """
+    # Interrompido pelo usuário: não inicia novos downloads
+    if _INTERRUPCAO.is_set():
+        return False
+    
     video_id = video_info.get('id')
     titulo = video_info.get('title', 'Sem título')
     duracao = video_info.get('duration', 0)
     upload_date = video_info.get('upload_date')  # Formato: AAAAMMDD
     
     logging.info("-" * 70)
-    logging.info(f"Processando: {titulo}")
-    logging.info(f"ID: {video_id} | Duração: {duracao}s | Upload: {upload_date or 'N/A'}")
+    logging.info("Processando: %s", titulo)
+    logging.info("ID: %s | Duração: %ss | Upload: %s", video_id, duracao, upload_date or 'N/A')
     
     # Define pasta de output
     pasta_output = PROJECT_ROOT / 'arquivos' / 'audios' / video_id
     
-    # Verifica se já existe (pula se configurado)
-    if pasta_output.exists() and not DOWNLOADER['comportamento']['sobrescrever']:
-        logging.info(f"Pasta {video_id} já existe. Pulando...")
+    # Reserva antes da verificação da pasta: outra thread pode estar com o mesmo vídeo
+    if not reservar_video(video_id):
+        logging.info("Vídeo %s já está sendo processado por outra thread. Pulando...", video_id)
         return True
     
-    # Cria pasta de output
-    pasta_output.mkdir(parents=True, exist_ok=True)
+    # Pasta só é removida se foi criada e o vídeo não chegou ao fim com sucesso
+    pasta_criada = False
+    sucesso = False
     
     try:
+        # Verifica se já existe (pula se configurado)
+        if pasta_output.exists() and not DOWNLOADER_SOBRESCREVER:
+            logging.info("Pasta %s já existe. Pulando...", video_id)
+            return True
+        
+        # Filtros só com os metadados em memória: vídeo rejeitado não cria nem remove pasta
         # Valida duração
         if not filtrar_por_duracao(duracao):
             registrar_rejeitado(url_original, f"Duração fora dos limites: {duracao}s")
-            shutil.rmtree(pasta_output, ignore_errors=True)
+            gravar_cache(video_id, duracao, upload_date, VEREDITO_DURACAO)
             return False
         
         # Valida data de upload
         passou_filtro_data, motivo_data = filtrar_por_data_upload(upload_date)
         if not passou_filtro_data:
-            logging.warning(f"Vídeo rejeitado: {motivo_data}")
+            logging.warning("Vídeo rejeitado: %s", motivo_data)
             registrar_rejeitado(url_original, motivo_data)
-            shutil.rmtree(pasta_output, ignore_errors=True)
+            gravar_cache(video_id, duracao, upload_date, VEREDITO_DATA)
             return False
         
-        # Baixa legendas (OBRIGATÓRIO)
-        tem_legenda, info_legenda = verificar_e_baixar_legendas(video_id, video_info, pasta_output)
+        # Seleciona legenda (OBRIGATÓRIO)
+        legenda = selecionar_legenda(video_id, video_info)
         
-        if not tem_legenda:
-            logging.warning(f"Vídeo rejeitado: sem legendas nas prioridades configuradas")
+        if legenda is None:
+            logging.warning("Vídeo rejeitado: sem legendas nas prioridades configuradas")
             registrar_rejeitado(url_original, "Sem legendas disponíveis")
-            shutil.rmtree(pasta_output, ignore_errors=True)
+            gravar_cache(video_id, duracao, upload_date, VEREDITO_SEM_LEGENDAS)
+            return False
+        
+        # Cria pasta de output (apenas para vídeos que passaram nos filtros)
+        pasta_output.mkdir(parents=True, exist_ok=True)
+        pasta_criada = True
+        
+        # Baixa legenda e áudio
+        idioma, is_auto = legenda
+        info_legenda, audio_ok = baixar_legenda_e_audio(video_id, video_info, idioma, is_auto, pasta_output)
+        
+        if not info_legenda:
+            logging.warning("Vídeo rejeitado: falha ao baixar legenda %s", idioma)
+            registrar_rejeitado(url_original, "Erro ao baixar legenda")
             return False
         
-        # Baixa áudio
-        if not baixar_audio(video_id, video_info['webpage_url'], pasta_output):
-            logging.error(f"Falha ao baixar áudio")
+        if not audio_ok:
+            logging.error("Falha ao baixar áudio")
             registrar_rejeitado(url_original, "Erro ao baixar áudio")
-            shutil.rmtree(pasta_output, ignore_errors=True)
             return False
         
         # Cria arquivo de metadados
         criar_metadata(video_info, url_original, info_legenda, pasta_output)
         
         # Sucesso!
-        logging.info(f"Download concluído com sucesso: {video_id}")
+        logging.info("Download concluído com sucesso: %s", video_id)
         registrar_sucesso(url_original)
+        gravar_cache(video_id, duracao, upload_date, VEREDITO_SUCESSO)
+        sucesso = True
         return True
     
     except Exception as e:
-        logging.error(f"Erro ao processar vídeo {video_id}: {e}")
+        logging.error("Erro ao processar vídeo %s: %s", video_id, e)
         registrar_rejeitado(url_original, f"Erro: {str(e)}")
-        shutil.rmtree(pasta_output, ignore_errors=True)
         return False
+    
+    finally:
+        # Limpeza única para todas as falhas após a criação da pasta
+        if pasta_criada and not sucesso:
+            remover_pasta_video(pasta_output)
+        liberar_video(video_id)
+
+
+def processar_entrada_playlist(entry: Dict, url_original: str, tipo: str, idx: int, total: int) -> None:
+    """
+    Processa um vídeo de playlist/canal (executado em uma thread do pool)
+    O início de cada vídeo é espaçado pelo LIMITADOR_VIDEOS
+    """
+    if _INTERRUPCAO.is_set():
+        return
+    
+    logging.info("\n[%s/%s] Processando vídeo da %s...", idx, total, tipo)
+    
+    # Reconstrói URL do vídeo a partir do ID
+    video_id = entry.get('id')
+    if not video_id:
+        logging.error("Vídeo %s sem ID. Pulando...", idx)
+        return
+    
+    # Vídeo já baixado em execução anterior: pula antes de qualquer requisição (e sem delay)
+    if not DOWNLOADER_SOBRESCREVER and (PROJECT_ROOT / 'arquivos' / 'audios' / video_id).exists():
+        logging.info("Pasta %s já existe. Pulando...", video_id)
+        return
+    
+    # Rejeitado em execução anterior: pula sem requisição (e sem delay)
+    motivo_cache = motivo_rejeicao_em_cache(video_id)
+    if motivo_cache:
+        logging.info("Vídeo %s rejeitado anteriormente (%s). Pulando...", video_id, motivo_cache)
+        return
+    
+    # Delay entre vídeos da playlist (ritmo global, com jitter); interrompido: não inicia
+    if not LIMITADOR_VIDEOS.aguardar():
+        return
+    
+    video_url = f"https://www.youtube.com/watch?v={video_id}"
+    logging.debug("URL reconstruída: %s", video_url)
+    
+    # Extrai informações completas do vídeo
+    video_info = extrair_info_video(video_url)
+    if not video_info:
+        logging.error("Falha ao extrair informações do vídeo %s", idx)
+        return
+    
+    # Processa vídeo
+    processar_video(video_info, url_original)
 
 
-def processar_playlist_ou_canal(info: Dict, url_original: str, tipo: str) -> None:
+def processar_playlist_ou_canal(info: Dict, url_original: str, tipo: str,
+                                executor: ThreadPoolExecutor) -> List[Future]:
     """
     Processa playlist ou canal (múltiplos vídeos)
+    Cada vídeo é enviado ao pool compartilhado; retorna os futures submetidos
     """
-    entries = info.get('entries', [])
+    entries = list(info.get('entries') or [])
     titulo = info.get('title', 'Sem título')
-    limit = DOWNLOADER['quantidade']['limit']
+    limit = LIMITE_POR_FONTE
     
     # Aplica limite se configurado
     if limit > 0:
         entries = entries[:limit]
-        logging.info(f"Aplicando limite de {limit} vídeos")
+        logging.info("Aplicando limite de %s vídeos", limit)
     
     total = len(entries)
-    logging.info(f"Processando {tipo}: {titulo} ({total} vídeos)")
+    logging.info("Processando %s: %s (%s vídeos)", tipo, titulo, total)
     
-    for idx, entry in enumerate(entries, 1):
-        logging.info(f"\n[{idx}/{total}] Processando vídeo da {tipo}...")
-        
-        # Reconstrói URL do vídeo a partir do ID
-        video_id = entry.get('id')
-        if not video_id:
-            logging.error(f"Vídeo {idx} sem ID. Pulando...")
-            continue
-        
-        video_url = f"https://www.youtube.com/watch?v={video_id}"
-        logging.debug(f"URL reconstruída: {video_url}")
-        
-        # Extrai informações completas do vídeo
-        video_info = extrair_info_video(video_url)
-        if not video_info:
-            logging.error(f"Falha ao extrair informações do vídeo {idx}")
-            continue
-        
-        # Processa vídeo
-        processar_video(video_info, url_original)
-        
-        # Delay entre vídeos da playlist
-        if idx < total:
-            delay = random.uniform(
-                DOWNLOADER['delays']['entre_videos_playlist']['minimo_segundos'],
-                DOWNLOADER['delays']['entre_videos_playlist']['maximo_segundos']
-            )
-            logging.info(f"Aguardando {delay:.2f}s antes do próximo vídeo...")
-            time.sleep(delay)
+    return [
+        executor.submit(processar_entrada_playlist, entry, url_original, tipo, idx, total)
+        for idx, entry in enumerate(entries, 1)
+    ]
 
 
 # ============================================================================
@@ -673,6 +1006,8 @@ def processar_playlist_ou_canal(info: Dict, url_original: str, tipo: str) -> Non
 def executar_downloads() -> None:
     """
     Loop principal de processamento de URLs do CSV
+    A thread principal enumera os links; os vídeos (de todos os links) são baixados
+    por um único pool de VIDEOS_SIMULTANEOS threads, espaçados pelos limitadores
     """
     links = ler_links_csv()
     total_links = len(links)
@@ -681,48 +1016,57 @@ def executar_downloads() -> None:
         logging.info("Nenhum link encontrado no CSV")
         return
     
-    logging.info(f"Total de links a processar: {total_links}")
+    logging.info("Total de links a processar: %s", total_links)
+    if VIDEOS_SIMULTANEOS > 1:
+        logging.info("Baixando até %s vídeos simultaneamente", VIDEOS_SIMULTANEOS)
     logging.info("="*70)
     
-    for idx, url in enumerate(links, 1):
-        logging.info(f"\n{'='*70}")
-        logging.info(f"LINK [{idx}/{total_links}]: {url}")
-        logging.info(f"{'='*70}")
-        
-        # Remove linha do CSV imediatamente
-        remover_linha_csv(url)
+    with ThreadPoolExecutor(max_workers=VIDEOS_SIMULTANEOS) as executor:
+        pendentes = []
         
         try:
-            # Extrai informações
-            info = extrair_info_video(url)
-            if not info:
-                logging.error(f"Falha ao extrair informações do link")
-                registrar_rejeitado(url, "Erro ao extrair informações")
-                continue
-            
-            # Identifica tipo
-            tipo = identificar_tipo_url(info)
-            logging.info(f"Tipo identificado: {tipo}")
-            
-            # Processa conforme tipo
-            if tipo == 'video':
-                processar_video(info, url)
-            else:
-                processar_playlist_ou_canal(info, url, tipo)
+            for idx, url in enumerate(links, 1):
+                logging.info("\n" + "=" * 70)
+                logging.info("LINK [%s/%s]: %s", idx, total_links, url)
+                logging.info("=" * 70)
+                
+                # Delay entre links do CSV (ritmo global, com jitter)
+                LIMITADOR_LINKS.aguardar()
+                
+                try:
+                    # Extrai informações (playlists/canais: só a lista de entradas;
+                    # cada vídeo é resolvido depois, imediatamente antes do seu download)
+                    info = extrair_lista_flat(url)
+                    if not info:
+                        logging.error("Falha ao extrair informações do link")
+                        registrar_rejeitado(url, "Erro ao extrair informações")
+                        continue
+                    
+                    # Identifica tipo
+                    tipo = identificar_tipo_url(info)
+                    logging.info("Tipo identificado: %s", tipo)
+                    
+                    # Envia ao pool conforme tipo
+                    if tipo == 'video':
+                        pendentes.append(executor.submit(processar_video, info, url))
+                    else:
+                        pendentes.extend(processar_playlist_ou_canal(info, url, tipo, executor))
+                
+                except Exception as e:
+                    logging.error("Erro crítico ao processar link: %s", e)
+                    registrar_rejeitado(url, f"Erro crítico: {str(e)}")
+                    continue
             
-            # Delay entre links do CSV
-            if idx < total_links:
-                delay = random.uniform(
-                    DOWNLOADER['delays']['entre_links_csv']['minimo_segundos'],
-                    DOWNLOADER['delays']['entre_links_csv']['maximo_segundos']
-                )
-                logging.info(f"\nAguardando {delay:.2f}s antes do próximo link do CSV...")
-                time.sleep(delay)
-        
-        except Exception as e:
-            logging.error(f"Erro crítico ao processar link: {e}")
-            registrar_rejeitado(url, f"Erro crítico: {str(e)}")
-            continue
+            # Aguarda os downloads ainda em andamento
+            for future in as_completed(pendentes):
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error("Erro ao processar vídeo: %s", e)
+        except KeyboardInterrupt:
+            # Sem isto, a saída do with esperaria todos os vídeos enfileirados
+            cancelar_downloads_pendentes(executor)
+            raise
     
     logging.info("\n" + "="*70)
     logging.info("PROCESSAMENTO CONCLUÍDO")
@@ -747,14 +1091,16 @@ def main():
     
     # Exibe configurações
     logging.info("\nConfigurações ativas:")
-    logging.info(f"  Formato áudio: {DOWNLOADER['audio']['formato']}")
-    logging.info(f"  Bitrate: {DOWNLOADER['audio']['bitrate_kbps']} kbps")
-    logging.info(f"  Sample rate: {DOWNLOADER['audio']['sample_rate_hz']} Hz")
-    logging.info(f"  Prioridade legendas: {DOWNLOADER['legendas']['prioridade']}")
-    logging.info(f"  Duração: {DOWNLOADER['filtros']['duracao']['minima_segundos']}s - {DOWNLOADER['filtros']['duracao']['maxima_segundos']}s")
-    logging.info(f"  Data upload mín: {DOWNLOADER['filtros']['data_upload']['minima']}")
-    logging.info(f"  Data upload máx: {DOWNLOADER['filtros']['data_upload']['maxima']}")
-    logging.info(f"  Limite por fonte: {DOWNLOADER['quantidade']['limit']}")
+    logging.info("  Formato áudio: %s", AUDIO_FORMATO)
+    logging.info("  Bitrate: %s kbps", AUDIO_BITRATE_KBPS)
+    logging.info("  Sample rate: %s Hz", AUDIO_SAMPLE_RATE_HZ)
+    logging.info("  Fragmentos simultâneos: %s", AUDIO_FRAGMENTOS_SIMULTANEOS)
+    logging.info("  Prioridade legendas: %s", DOWNLOADER['legendas']['prioridade'])
+    logging.info("  Duração: %ss - %ss", DURACAO_MIN_SEGUNDOS, DURACAO_MAX_SEGUNDOS)
+    logging.info("  Data upload mín: %s", DATA_UPLOAD_MINIMA)
+    logging.info("  Data upload máx: %s", DATA_UPLOAD_MAXIMA)
+    logging.info("  Limite por fonte: %s", LIMITE_POR_FONTE)
+    logging.info("  Vídeos simultâneos: %s", VIDEOS_SIMULTANEOS)
     logging.info("")
     
     # Executa downloads
@@ -764,7 +1110,7 @@ def main():
         logging.warning("\nProcesso interrompido pelo usuário")
         sys.exit(0)
     except Exception as e:
-        logging.error(f"Erro fatal: {e}")
+        logging.error("Erro fatal: %s", e)
         sys.exit(1)
 
 
@@ -5,10 +5,18 @@ Gerenciador centralizado de modelos de IA usando padrao Singleton
 Carrega modelos 1x e reutiliza entre multiplas execucoes
 """
 
+import gc
+import logging
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Any, Tuple
-import torch
+from typing import Callable, Optional, Any, Tuple
+
+import numpy as np
 
 # Adicionar pasta raiz ao path para importar config
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -24,6 +32,10 @@ from config import (
 )
 
 
+# Mensagens de carga/descarga via logging: formatacao adiada e nivel controlavel pelo chamador
+logger = logging.getLogger(__name__)
+
+
 # ==============================================================================
 # CONSTANTES - IDs DOS MODELOS (HARDCODED)
 # ==============================================================================
@@ -32,6 +44,53 @@ WHISPER_MODEL_ID = "freds0/distil-whisper-large-v3-ptbr"
 WAV2VEC_MODEL_ID = "lgris/wav2vec2-large-xlsr-open-brazilian-portuguese"
 PYANNOTE_MODEL_ID = "pyannote/speaker-diarization-3.1"
 
+# Validade da leitura de VRAM memorizada (consultas seguidas nao tocam a GPU)
+VRAM_CACHE_TTL_SEGUNDOS = 0.5
+
+# Forwards descartaveis apos carregar um modelo em GPU (pre-aquece alocador CUDA)
+AQUECIMENTO_FORWARDS = 2
+
+
+# ==============================================================================
+# IMPORT SOB DEMANDA - PYTORCH
+# ==============================================================================
+
+@lru_cache(maxsize=1)
+def _torch():
+    """
+    Importa torch apenas no primeiro uso (importar o modulo nao carrega o PyTorch)
+    
+    Returns:
+        Modulo torch
+    """
+    import torch
+    return torch
+
+
+@lru_cache(maxsize=1)
+def _cuda_disponivel() -> bool:
+    """
+    Consulta disponibilidade de CUDA 1x por processo (evita chamar o driver a cada uso)
+    
+    Returns:
+        True se ha GPU CUDA utilizavel
+    """
+    return _torch().cuda.is_available()
+
+
+@lru_cache(maxsize=1)
+def _configurar_backends_cuda():
+    """
+    Habilita TF32 nos backends CUDA (executa 1x, no primeiro modelo em GPU)
+    
+    Matmuls e convolucoes em float32 (SQUIM, pyannote, DeepFilterNet) passam a
+    usar tensor cores em GPUs Ampere+; sem efeito em GPUs anteriores
+    """
+    torch = _torch()
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    torch.set_float32_matmul_precision("high")
+
 
 # ==============================================================================
 # CLASSE SINGLETON - GERENCIADOR DE MODELOS
@@ -44,12 +103,16 @@ class ModelManager:
     """
     
     _instance = None  # Instancia unica do singleton
+    _lock = threading.Lock()  # Protege criacao/inicializacao entre threads
     
     def __new__(cls):
-        """Implementacao do padrao Singleton"""
+        """Implementacao do padrao Singleton (double-checked locking)"""
         if cls._instance is None:
-            cls._instance = super(ModelManager, cls).__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instancia = super(ModelManager, cls).__new__(cls)
+                    instancia._initialized = False
+                    cls._instance = instancia
         return cls._instance
     
     def __init__(self):
@@ -57,21 +120,33 @@ class ModelManager:
         if self._initialized:
             return
         
-        # Cache de modelos carregados
-        self._whisper = None
-        self._wav2vec = None
-        self._pyannote = None
-        self._squim = None
-        self._deepfilternet = None
+        with self.__class__._lock:
+            # Outra thread pode ter inicializado enquanto esperava o lock
+            if self._initialized:
+                return
+            
+            # Cache de modelos carregados
+            self._whisper = None
+            self._wav2vec = None
+            self._pyannote = None
+            self._squim = None
+            self._deepfilternet = None
+            self._locks = {
+                nome: threading.Lock()
+                for nome in ('whisper', 'wav2vec', 'pyannote', 'squim', 'deepfilternet')
+            }
+            
+            # Memo de uso de VRAM (evita sincronizar com a GPU em polling)
+            self._vram_cache: Optional[dict] = None
+            self._vram_cache_ts = 0.0
+            
+            # VRAM total e imutavel: consultada ao driver apenas 1x (no primeiro uso)
+            self._vram_total_gb: Optional[float] = None
+            
+            # Marca como inicializado
+            self._initialized = True
         
-        # Marca como inicializado
-        self._initialized = True
-        
-        print("\n" + "="*70)
-        print("MODEL MANAGER INICIALIZADO")
-        print("="*70)
-        print("Modelos serao carregados sob demanda (lazy loading)")
-        print("="*70 + "\n")
+        logger.info("MODEL MANAGER INICIALIZADO: modelos serao carregados sob demanda (lazy loading)")
     
     # ==========================================================================
     # METODOS AUXILIARES - DEVICE MANAGEMENT
@@ -89,15 +164,67 @@ class ModelManager:
         """
         device_config = config_device.lower()
         
-        if device_config == "auto":
-            return "cuda" if torch.cuda.is_available() else "cpu"
-        elif device_config == "gpu":
-            if not torch.cuda.is_available():
-                print("AVISO: GPU solicitada mas CUDA nao disponivel. Usando CPU.")
-                return "cpu"
-            return "cuda"
-        else:  # cpu
+        if device_config == "cpu":
             return "cpu"
+        
+        # "auto" ou "gpu"
+        if not _cuda_disponivel():
+            if device_config == "gpu":
+                logger.warning("AVISO: GPU solicitada mas CUDA nao disponivel. Usando CPU.")
+            return "cpu"
+        
+        _configurar_backends_cuda()
+        return "cuda"
+    
+    def _obter_dtype(self, device: str) -> Any:
+        """
+        Determina dtype dos pesos para os pipelines do transformers
+        
+        Args:
+            device: "cuda" ou "cpu"
+            
+        Returns:
+            torch.float16 em GPU (tensor cores, metade da VRAM), torch.float32 em CPU
+        """
+        torch = _torch()
+        return torch.float16 if device == "cuda" else torch.float32
+    
+    def _quantizar_int8(self, modelo: Any) -> Any:
+        """
+        Aplica quantizacao dinamica INT8 nas camadas Linear (uso em CPU)
+        
+        Args:
+            modelo: nn.Module em float32 no CPU
+            
+        Returns:
+            Copia do modelo com Linear quantizadas (pesos int8, ativacoes em float)
+        """
+        torch = _torch()
+        
+        # fbgemm (x86) quando disponivel; qnnpack nas demais arquiteturas (ARM)
+        engines = torch.backends.quantized.supported_engines
+        torch.backends.quantized.engine = "fbgemm" if "fbgemm" in engines else "qnnpack"
+        
+        return torch.ao.quantization.quantize_dynamic(modelo, {torch.nn.Linear}, dtype=torch.qint8)
+    
+    def _aquecer(self, nome: str, executar: Callable[[], Any]):
+        """
+        Executa forwards descartaveis logo apos a carga em GPU
+        
+        O alocador CUDA reserva os blocos e o cuDNN/cuBLAS inicializa seus handles
+        aqui, e nao no primeiro audio real. Falha no aquecimento nao impede o uso do modelo
+        
+        Args:
+            nome: Nome do modelo (para log)
+            executar: Funcao sem argumentos que roda 1 forward com entrada dummy
+        """
+        try:
+            with _torch().inference_mode():
+                for _ in range(AQUECIMENTO_FORWARDS):
+                    executar()
+            logger.info("Aquecimento %s concluido (%s forwards)", nome, AQUECIMENTO_FORWARDS)
+        except Exception as e:
+            logger.warning("AVISO: aquecimento do %s falhou (modelo segue utilizavel): %s", nome, e)
     
     def _obter_device_id(self, device: str) -> int:
         """
@@ -130,40 +257,56 @@ class ModelManager:
         if self._whisper is not None:
             return self._whisper
         
-        # Verifica se modulo esta ativo no MASTER
-        if not MASTER.get('transcricao_whisper', False):
-            raise RuntimeError("ERRO: Whisper desabilitado no MASTER config")
-        
-        print("\n" + "-"*70)
-        print("CARREGANDO MODELO: Whisper")
-        print("-"*70)
-        
-        try:
-            from transformers import pipeline
-            
-            # Obter device do bloco especifico
-            device = self._obter_device(STT_WHISPER.get('device', 'auto'))
-            device_id = self._obter_device_id(device)
-            
-            print(f"Modelo: {WHISPER_MODEL_ID}")
-            print(f"Device: {device}")
-            
-            # Carregar modelo
-            self._whisper = pipeline(
-                "automatic-speech-recognition",
-                model=WHISPER_MODEL_ID,
-                device=device_id
-            )
-            
-            print("✓ Whisper carregado com sucesso")
-            print("-"*70 + "\n")
-            
-            return self._whisper
-            
-        except Exception as e:
-            print(f"✗ ERRO ao carregar Whisper: {e}")
-            print("-"*70 + "\n")
-            raise
+        # Carga unica mesmo com chamadas concorrentes (lock por modelo)
+        with self._locks['whisper']:
+            if self._whisper is not None:
+                return self._whisper
+            
+            # Verifica se modulo esta ativo no MASTER
+            if not MASTER.get('transcricao_whisper', False):
+                raise RuntimeError("ERRO: Whisper desabilitado no MASTER config")
+            
+            try:
+                from transformers import pipeline
+                
+                # Obter device do bloco especifico
+                device = self._obter_device(STT_WHISPER.get('device', 'auto'))
+                device_id = self._obter_device_id(device)
+                
+                # Um registro só por modelo: no autoteste os modelos carregam em paralelo
+                logger.info("CARREGANDO MODELO: Whisper (%s, device=%s, dtype=%s)",
+                            WHISPER_MODEL_ID, device, self._obter_dtype(device))
+                
+                # Carregar modelo (atencao via SDPA fundida do PyTorch); montado em local e
+                # publicado em self._whisper so no fim: o caminho sem lock nunca ve carga parcial
+                pipe = pipeline(
+                    "automatic-speech-recognition",
+                    model=WHISPER_MODEL_ID,
+                    device=device_id,
+                    torch_dtype=self._obter_dtype(device),
+                    model_kwargs={"attn_implementation": "sdpa"}
+                )
+                
+                # CPU: quantizacao INT8 opcional (pesos Linear em int8)
+                if device == "cpu" and STT_WHISPER.get('quantizar_int8_cpu', False):
+                    pipe.model = self._quantizar_int8(pipe.model)
+                    logger.info("Quantizacao INT8 aplicada (CPU): Whisper")
+                
+                if device == "cuda":
+                    # 1s de silencio; 1 token basta para exercitar encoder e decoder
+                    silencio = np.zeros(16000, dtype=np.float32)
+                    self._aquecer("Whisper", lambda: pipe(
+                        silencio, generate_kwargs={"max_new_tokens": 1}))
+                
+                self._whisper = pipe
+                
+                logger.info("✓ Whisper carregado com sucesso")
+                
+                return self._whisper
+                
+            except Exception as e:
+                logger.error("✗ ERRO ao carregar Whisper: %s", e)
+                raise
     
     # ==========================================================================
     # WAV2VEC - STT
@@ -184,40 +327,52 @@ class ModelManager:
         if self._wav2vec is not None:
             return self._wav2vec
         
-        # Verifica se modulo esta ativo no MASTER
-        if not MASTER.get('transcricao_wav2vec', False):
-            raise RuntimeError("ERRO: wav2vec desabilitado no MASTER config")
-        
-        print("\n" + "-"*70)
-        print("CARREGANDO MODELO: wav2vec")
-        print("-"*70)
-        
-        try:
-            from transformers import pipeline
-            
-            # Obter device do bloco especifico
-            device = self._obter_device(STT_WAV2VEC2.get('device', 'auto'))
-            device_id = self._obter_device_id(device)
-            
-            print(f"Modelo: {WAV2VEC_MODEL_ID}")
-            print(f"Device: {device}")
-            
-            # Carregar modelo
-            self._wav2vec = pipeline(
-                "automatic-speech-recognition",
-                model=WAV2VEC_MODEL_ID,
-                device=device_id
-            )
-            
-            print("✓ wav2vec carregado com sucesso")
-            print("-"*70 + "\n")
-            
-            return self._wav2vec
-            
-        except Exception as e:
-            print(f"✗ ERRO ao carregar wav2vec: {e}")
-            print("-"*70 + "\n")
-            raise
+        # Carga unica mesmo com chamadas concorrentes (lock por modelo)
+        with self._locks['wav2vec']:
+            if self._wav2vec is not None:
+                return self._wav2vec
+            
+            # Verifica se modulo esta ativo no MASTER
+            if not MASTER.get('transcricao_wav2vec', False):
+                raise RuntimeError("ERRO: wav2vec desabilitado no MASTER config")
+            
+            try:
+                from transformers import pipeline
+                
+                # Obter device do bloco especifico
+                device = self._obter_device(STT_WAV2VEC2.get('device', 'auto'))
+                device_id = self._obter_device_id(device)
+                
+                logger.info("CARREGANDO MODELO: wav2vec (%s, device=%s, dtype=%s)",
+                            WAV2VEC_MODEL_ID, device, self._obter_dtype(device))
+                
+                # Carregar modelo (atencao via SDPA fundida do PyTorch)
+                pipe = pipeline(
+                    "automatic-speech-recognition",
+                    model=WAV2VEC_MODEL_ID,
+                    device=device_id,
+                    torch_dtype=self._obter_dtype(device),
+                    model_kwargs={"attn_implementation": "sdpa"}
+                )
+                
+                # CPU: quantizacao INT8 opcional (pesos Linear em int8)
+                if device == "cpu" and STT_WAV2VEC2.get('quantizar_int8_cpu', False):
+                    pipe.model = self._quantizar_int8(pipe.model)
+                    logger.info("Quantizacao INT8 aplicada (CPU): wav2vec")
+                
+                if device == "cuda":
+                    silencio = np.zeros(16000, dtype=np.float32)
+                    self._aquecer("wav2vec", lambda: pipe(silencio))
+                
+                self._wav2vec = pipe
+                
+                logger.info("✓ wav2vec carregado com sucesso")
+                
+                return self._wav2vec
+                
+            except Exception as e:
+                logger.error("✗ ERRO ao carregar wav2vec: %s", e)
+                raise
     
     # ==========================================================================
     # PYANNOTE - OVERLAP DETECTION
@@ -238,47 +393,47 @@ class ModelManager:
         if self._pyannote is not None:
             return self._pyannote
         
-        # Verifica se modulo esta ativo no MASTER
-        if not MASTER.get('overlap', False):
-            raise RuntimeError("ERRO: Overlap detector desabilitado no MASTER config")
-        
-        print("\n" + "-"*70)
-        print("CARREGANDO MODELO: pyannote")
-        print("-"*70)
-        
-        try:
-            from pyannote.audio import Pipeline
-            
-            # Obter device do bloco especifico
-            device = self._obter_device(OVERLAP_DETECTOR.get('device', 'auto'))
-            
-            # Token HuggingFace (opcional)
-            hf_token = OVERLAP_DETECTOR.get('hf_token')
-            
-            print(f"Modelo: {PYANNOTE_MODEL_ID}")
-            print(f"Device: {device}")
-            
-            # Carregar modelo
-            if hf_token:
-                self._pyannote = Pipeline.from_pretrained(
-                    PYANNOTE_MODEL_ID,
-                    token=hf_token
-                )
-            else:
-                self._pyannote = Pipeline.from_pretrained(PYANNOTE_MODEL_ID)
-            
-            # Mover para device
-            self._pyannote.to(torch.device(device))
-            
-            print("✓ pyannote carregado com sucesso")
-            print("-"*70 + "\n")
-            
-            return self._pyannote
-            
-        except Exception as e:
-            print(f"✗ ERRO ao carregar pyannote: {e}")
-            print("-"*70 + "\n")
-            raise
+        # Carga unica mesmo com chamadas concorrentes (lock por modelo)
+        with self._locks['pyannote']:
+            if self._pyannote is not None:
+                return self._pyannote
+            
+            # Verifica se modulo esta ativo no MASTER
+            if not MASTER.get('overlap', False):
+                raise RuntimeError("ERRO: Overlap detector desabilitado no MASTER config")
+            
+            try:
+                from pyannote.audio import Pipeline
+                
+                # Obter device do bloco especifico
+                device = self._obter_device(OVERLAP_DETECTOR.get('device', 'auto'))
+                
+                # Token HuggingFace (opcional)
+                hf_token = OVERLAP_DETECTOR.get('hf_token')
+                
+                logger.info("CARREGANDO MODELO: pyannote (%s, device=%s)", PYANNOTE_MODEL_ID, device)
+                
+                # Carregar modelo (em local; publicado em self._pyannote so depois de pronto)
+                if hf_token:
+                    pipe = Pipeline.from_pretrained(
+                        PYANNOTE_MODEL_ID,
+                        token=hf_token
+                    )
+                else:
+                    pipe = Pipeline.from_pretrained(PYANNOTE_MODEL_ID)
+                
+                # Mover para device
+                pipe.to(_torch().device(device))
+                
+                self._pyannote = pipe
+                
+                logger.info("✓ pyannote carregado com sucesso")
+                
+                return self._pyannote
+                
+            except Exception as e:
+                logger.error("✗ ERRO ao carregar pyannote: %s", e)
+                raise
     
     # ==========================================================================
     # SQUIM - MOS QUALITY ASSESSMENT
@@ -299,36 +454,41 @@ class ModelManager:
         if self._squim is not None:
             return self._squim
         
-        # Verifica se modulo esta ativo no MASTER
-        if not MASTER.get('mos_filter', False):
-            raise RuntimeError("ERRO: MOS filter desabilitado no MASTER config")
-        
-        print("\n" + "-"*70)
-        print("CARREGANDO MODELO: SQUIM")
-        print("-"*70)
-        
-        try:
-            import torchaudio
-            
-            # Obter device do bloco especifico
-            device = self._obter_device(MOS_FILTER.get('device', 'auto'))
-            
-            print(f"Modelo: SQUIM_OBJECTIVE (torchaudio)")
-            print(f"Device: {device}")
-            
-            # Carregar modelo
-            self._squim = torchaudio.pipelines.SQUIM_OBJECTIVE.get_model()
-            self._squim = self._squim.to(device)
-            
-            print("✓ SQUIM carregado com sucesso")
-            print("-"*70 + "\n")
-            
-            return self._squim
-            
-        except Exception as e:
-            print(f"✗ ERRO ao carregar SQUIM: {e}")
-            print("-"*70 + "\n")
-            raise
+        # Carga unica mesmo com chamadas concorrentes (lock por modelo)
+        with self._locks['squim']:
+            if self._squim is not None:
+                return self._squim
+            
+            # Verifica se modulo esta ativo no MASTER
+            if not MASTER.get('mos_filter', False):
+                raise RuntimeError("ERRO: MOS filter desabilitado no MASTER config")
+            
+            try:
+                import torchaudio
+                
+                # Obter device do bloco especifico
+                device = self._obter_device(MOS_FILTER.get('device', 'auto'))
+                
+                logger.info("CARREGANDO MODELO: SQUIM (SQUIM_OBJECTIVE torchaudio, device=%s)", device)
+                
+                # Carregar modelo (em local; publicado em self._squim so depois de pronto)
+                modelo = torchaudio.pipelines.SQUIM_OBJECTIVE.get_model()
+                modelo = modelo.to(device).eval()
+                
+                if device == "cuda":
+                    # Mesmo shape usado pelo m06 (batch de 12s @ 16kHz)
+                    entrada = _torch().zeros(1, 192000, device=device)
+                    self._aquecer("SQUIM", lambda: modelo(entrada))
+                
+                self._squim = modelo
+                
+                logger.info("✓ SQUIM carregado com sucesso")
+                
+                return self._squim
+                
+            except Exception as e:
+                logger.error("✗ ERRO ao carregar SQUIM: %s", e)
+                raise
     
     # ==========================================================================
     # DEEPFILTERNET3 - AUDIO DENOISING
@@ -349,78 +509,144 @@ class ModelManager:
         if self._deepfilternet is not None:
             return self._deepfilternet
         
-        # Verifica se modulo esta ativo no MASTER
-        if not MASTER.get('Denoiser', False):
-            raise RuntimeError("ERRO: Denoiser desabilitado no MASTER config")
-        
-        print("\n" + "-"*70)
-        print("CARREGANDO MODELO: DeepFilterNet3")
-        print("-"*70)
-        
-        try:
-            from df import init_df
-            
-            # Obter device do bloco especifico
-            device = self._obter_device(DEEPFILTERNET_DENOISER.get('device', 'auto'))
-            
-            # Parametros do DeepFilterNet
-            post_filter = DEEPFILTERNET_DENOISER.get('post_filter', 1)
-            
-            print(f"Modelo: DeepFilterNet3")
-            print(f"Device: {device}")
-            print(f"Post-filter: {post_filter}")
-            
-            # Carregar modelo
-            modelo, df_state, _ = init_df(
-                post_filter=post_filter,
-                log_level="ERROR"  # Reduz verbosidade
-            )
-            
-            # Mover modelo para device
-            modelo = modelo.to(device)
-            
-            # Obter sample rate do df_state
-            sr = df_state.sr()
-            
-            # Armazenar tupla completa
-            self._deepfilternet = (modelo, df_state, sr)
-            
-            print(f"✓ DeepFilterNet3 carregado com sucesso (SR={sr} Hz)")
-            print("-"*70 + "\n")
-            
-            return self._deepfilternet
-            
-        except Exception as e:
-            print(f"✗ ERRO ao carregar DeepFilterNet3: {e}")
-            print("-"*70 + "\n")
-            raise
+        # Carga unica mesmo com chamadas concorrentes (lock por modelo)
+        with self._locks['deepfilternet']:
+            if self._deepfilternet is not None:
+                return self._deepfilternet
+            
+            # Verifica se modulo esta ativo no MASTER
+            if not MASTER.get('Denoiser', False):
+                raise RuntimeError("ERRO: Denoiser desabilitado no MASTER config")
+            
+            try:
+                from df import init_df
+                
+                # Obter device do bloco especifico
+                device = self._obter_device(DEEPFILTERNET_DENOISER.get('device', 'auto'))
+                
+                # Parametros do DeepFilterNet
+                post_filter = DEEPFILTERNET_DENOISER.get('post_filter', 1)
+                
+                logger.info("CARREGANDO MODELO: DeepFilterNet3 (device=%s, post_filter=%s)", device, post_filter)
+                
+                # Carregar modelo
+                modelo, df_state, _ = init_df(
+                    post_filter=post_filter,
+                    log_level="ERROR"  # Reduz verbosidade
+                )
+                
+                # Mover modelo para device (modo avaliacao: sem dropout/estatisticas de treino)
+                modelo = modelo.to(device).eval()
+                
+                # Obter sample rate do df_state
+                sr = df_state.sr()
+                
+                if device == "cuda":
+                    # 1s de silencio no SR do modelo (enhance move a entrada para o device)
+                    from df.enhance import enhance
+                    silencio = _torch().zeros(1, sr)
+                    self._aquecer("DeepFilterNet3", lambda: enhance(modelo, df_state, silencio))
+                
+                # Armazenar tupla completa
+                self._deepfilternet = (modelo, df_state, sr)
+                
+                logger.info("✓ DeepFilterNet3 carregado com sucesso (SR=%s Hz)", sr)
+                
+                return self._deepfilternet
+                
+            except Exception as e:
+                logger.error("✗ ERRO ao carregar DeepFilterNet3: %s", e)
+                raise
     
     # ==========================================================================
     # UTILIDADES - GESTAO DE MEMORIA
     # ==========================================================================
     
+    def _descarregar(self, nome: str):
+        """
+        Remove modelo do cache e devolve a memoria (RAM e VRAM)
+        
+        Args:
+            nome: Chave do modelo ("whisper", "wav2vec", "pyannote", "squim", "deepfilternet")
+        """
+        with self._locks[nome]:
+            if getattr(self, f"_{nome}") is None:
+                return
+            setattr(self, f"_{nome}", None)
+        
+        # Libera referencias ciclicas e devolve blocos do alocador CUDA ao driver
+        gc.collect()
+        if _cuda_disponivel():
+            _torch().cuda.empty_cache()
+            self._vram_cache = None
+        
+        logger.info("✓ Modelo descarregado: %s", nome)
+    
+    def unload_whisper(self):
+        """Descarrega Whisper (proxima chamada de get_whisper recarrega)"""
+        self._descarregar('whisper')
+    
+    def unload_wav2vec(self):
+        """Descarrega wav2vec (proxima chamada de get_wav2vec recarrega)"""
+        self._descarregar('wav2vec')
+    
+    def unload_pyannote(self):
+        """Descarrega pyannote (proxima chamada de get_pyannote recarrega)"""
+        self._descarregar('pyannote')
+    
+    def unload_squim(self):
+        """Descarrega SQUIM (proxima chamada de get_squim recarrega)"""
+        self._descarregar('squim')
+    
+    def unload_deepfilternet(self):
+        """Descarrega DeepFilterNet (proxima chamada de get_deepfilternet recarrega)"""
+        self._descarregar('deepfilternet')
+    
+    @contextmanager
+    def inference(self):
+        """
+        Contexto para rodar modelos sem autograd (torch.inference_mode)
+        
+        Mais restrito que no_grad: tambem desliga contadores de versao dos tensores.
+        Uso: with manager.inference(): saida = modelo(entrada)
+        """
+        with _torch().inference_mode():
+            yield
+    
     def clear_cache(self):
         """Limpa cache de GPU (util para liberar VRAM)"""
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-            print("✓ Cache GPU limpo")
+        if _cuda_disponivel():
+            _torch().cuda.empty_cache()
+            self._vram_cache = None  # Memoria reservada mudou
+            logger.info("✓ Cache GPU limpo")
     
     def get_vram_usage(self) -> dict:
         """
-        Obtem uso atual de VRAM
+        Obtem uso atual de VRAM (memorizado por VRAM_CACHE_TTL_SEGUNDOS)
         
         Returns:
             Dict com informacoes de memoria GPU
         """
-        if not torch.cuda.is_available():
-            return {"available": False}
+        agora = time.monotonic()
+        if self._vram_cache is not None and agora - self._vram_cache_ts < VRAM_CACHE_TTL_SEGUNDOS:
+            return self._vram_cache
+        
+        if not _cuda_disponivel():
+            vram = {"available": False}
+        else:
+            torch = _torch()
+            if self._vram_total_gb is None:
+                self._vram_total_gb = torch.cuda.get_device_properties(0).total_memory / 1024**3
+            vram = {
+                "available": True,
+                "allocated_gb": torch.cuda.memory_allocated() / 1024**3,
+                "reserved_gb": torch.cuda.memory_reserved() / 1024**3,
+                "total_gb": self._vram_total_gb
+            }
         
-        return {
-            "available": True,
-            "allocated_gb": torch.cuda.memory_allocated() / 1024**3,
-            "reserved_gb": torch.cuda.memory_reserved() / 1024**3,
-            "total_gb": torch.cuda.get_device_properties(0).total_memory / 1024**3
-        }
+        self._vram_cache = vram
+        self._vram_cache_ts = agora
+        return vram
     
     def print_status(self):
         """Imprime status atual dos modelos carregados"""
@@ -464,6 +690,9 @@ def get_manager() -> ModelManager:
 # ==============================================================================
 
 if __name__ == "__main__":
+    # Teste manual: exibe as mensagens INFO de carga dos modelos
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("TESTANDO MODEL MANAGER")
     print("="*70)
     print("Este teste carregara TODOS os modelos habilitados no MASTER")
@@ -479,7 +708,7 @@ if __name__ == "__main__":
     # Status inicial
     manager.print_status()
     
-    # Carregar modelos conforme MASTER
+    # Carregar modelos conforme MASTER (em paralelo: I/O de disco/rede e init CUDA se sobrepoem)
     modelos_carregados = 0
     modelos_falhados = 0
     
@@ -487,60 +716,31 @@ if __name__ == "__main__":
     print("INICIANDO CARREGAMENTO DOS MODELOS")
     print("="*70)
     
-    # Whisper
-    if MASTER.get('transcricao_whisper', False):
-        try:
-            manager.get_whisper()
-            modelos_carregados += 1
-        except Exception as e:
-            print(f"[FALHA] Whisper nao pode ser carregado: {e}")
-            modelos_falhados += 1
-    else:
-        print("[SKIP] Whisper desabilitado no MASTER")
-    
-    # wav2vec
-    if MASTER.get('transcricao_wav2vec', False):
-        try:
-            manager.get_wav2vec()
-            modelos_carregados += 1
-        except Exception as e:
-            print(f"[FALHA] wav2vec nao pode ser carregado: {e}")
-            modelos_falhados += 1
-    else:
-        print("[SKIP] wav2vec desabilitado no MASTER")
-    
-    # pyannote
-    if MASTER.get('overlap', False):
-        try:
-            manager.get_pyannote()
-            modelos_carregados += 1
-        except Exception as e:
-            print(f"[FALHA] pyannote nao pode ser carregado: {e}")
-            modelos_falhados += 1
-    else:
-        print("[SKIP] pyannote desabilitado no MASTER")
-    
-    # SQUIM
-    if MASTER.get('mos_filter', False):
-        try:
-            manager.get_squim()
-            modelos_carregados += 1
-        except Exception as e:
-            print(f"[FALHA] SQUIM nao pode ser carregado: {e}")
-            modelos_falhados += 1
-    else:
-        print("[SKIP] SQUIM desabilitado no MASTER")
-    
-    # DeepFilterNet
-    if MASTER.get('Denoiser', False):
-        try:
-            manager.get_deepfilternet()
-            modelos_carregados += 1
-        except Exception as e:
-            print(f"[FALHA] DeepFilterNet nao pode ser carregado: {e}")
-            modelos_falhados += 1
-    else:
-        print("[SKIP] DeepFilterNet desabilitado no MASTER")
+    carregadores = [
+        ('transcricao_whisper', 'Whisper', manager.get_whisper),
+        ('transcricao_wav2vec', 'wav2vec', manager.get_wav2vec),
+        ('overlap', 'pyannote', manager.get_pyannote),
+        ('mos_filter', 'SQUIM', manager.get_squim),
+        ('Denoiser', 'DeepFilterNet', manager.get_deepfilternet),
+    ]
+    
+    tarefas = []
+    for flag, nome, carregar in carregadores:
+        if MASTER.get(flag, False):
+            tarefas.append((nome, carregar))
+        else:
+            print(f"[SKIP] {nome} desabilitado no MASTER")
+    
+    if tarefas:
+        with ThreadPoolExecutor(max_workers=len(tarefas)) as executor:
+            futuros = {executor.submit(carregar): nome for nome, carregar in tarefas}
+            for futuro in as_completed(futuros):
+                try:
+                    futuro.result()
+                    modelos_carregados += 1
+                except Exception as e:
+                    print(f"[FALHA] {futuros[futuro]} nao pode ser carregado: {e}")
+                    modelos_falhados += 1
     
     # Relatorio final
     print("\n" + "="*70)
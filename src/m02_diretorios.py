@@ -1,4 +1,5 @@
 from pathlib import Path
+import os
 import shutil
 
 # Definir PROJECT_ROOT no escopo global
@@ -8,6 +9,29 @@ id_video = 'B4RgpqJhoIo'
 
 print(str(PROJECT_ROOT) + "/arquivos/temp/" + id_video)
 
+# Subpastas de arquivos intermediarios (arquivos/temp/{id_video}/...)
+SUBPASTAS_TEMP = (
+    '00-json_dinamico',           # .json dinâmicos
+    '01-arquivos_originais',      # copias dos arquivos originais
+    '02-segmentos_originais',     # segmentos com sr original
+    '03-segments_16khz',          # segmentos com sr a 16 khz
+    '04-mos_score',               # arquivos da MOS
+    '05-overlap1',                # arquivos do overlap 1
+    '06-stt_whisper',             # arquivos do stt_whisper
+    '07-stt_wav2vec',             # arquivos do stt_wav2vec
+    '08-normalizador_texto',      # arquivos do normalizador_texto
+    '09-validacao_levenshtein',   # arquivos do validacao_levenstein
+    '10-denoiser',                # arquivos do denoiser
+    '11-normalizador_audio',      # arquivos do normalizador_audio
+)
+
+# Subpastas do dataset final (dataset/...)
+SUBPASTAS_DATASET = (
+    'audio_dataset',
+    'historico_dataset',
+    'log',
+)
+
 def criar_diretorios():
     #============================================================
     # Criando pasta geral do vídeo onde estará todos as subpastas
@@ -18,93 +42,38 @@ def criar_diretorios():
     #============================================================
     # Criando subpastas para arquivos intermediarios
     #============================================================
-    # criar pasta para os .json dinâmicos
-    pasta1 = pasta / '00-json_dinamico'
-    pasta1.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com as copias dos arquivos originais
-    pasta1 = pasta / '01-arquivos_originais'
-    pasta1.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com os segmentos com sr original
-    pasta2 = pasta / '02-segmentos_originais'
-    pasta2.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com os segmetnos com sr a 16 khz
-    pasta3 = pasta / '03-segments_16khz'
-    pasta3.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com arquivos da MOS
-    pasta4 = pasta / '04-mos_score'
-    pasta4.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com arquivos do overlap 1
-    pasta5 = pasta / '05-overlap1'
-    pasta5.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com arquivos do -stt_whisper
-    pasta6 = pasta / '06-stt_whisper'
-    pasta6.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com arquivos do stt_wav2vec
-    pasta7 = pasta / '07-stt_wav2vec'
-    pasta7.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com arquivos do normalizador_texto
-    pasta8 = pasta / '08-normalizador_texto'
-    pasta8.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com arquivos do validacao_levenstein
-    pasta9 = pasta / '09-validacao_levenshtein'
-    pasta9.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com arquivos do denoiser
-    pasta10 = pasta / '10-denoiser'
-    pasta10.mkdir(parents=True, exist_ok=True)
-
-    # criar pasta com arquivos do normalizador_audio
-    pasta11 = pasta / '11-normalizador_audio'
-    pasta11.mkdir(parents=True, exist_ok=True)
+    # Pasta pai ja existe: cada subpasta e um unico mkdir
+    for nome in SUBPASTAS_TEMP:
+        (pasta / nome).mkdir(exist_ok=True)
 
     #########################################################
     #============================================================
     # Criando copia dos arquivos originais
     #============================================================
     pasta_origem = PROJECT_ROOT / "arquivos" / "audios" / id_video
-    pasta_destino = pasta1
-
-    # Garantir que destino existe
-    pasta_destino.mkdir(parents=True, exist_ok=True)
+    pasta_destino = pasta / '01-arquivos_originais'
 
     # Verificar se a pasta de origem existe antes de copiar
     if not pasta_origem.exists():
         print(f"AVISO: Pasta de origem não encontrada: {pasta_origem}")
     else:
         # Copiar TODOS os arquivos (qualquer tipo, qualquer nome)
-        for item in pasta_origem.iterdir():
-            if item.is_file():
-                shutil.copy2(item, pasta_destino / item.name)
+        # scandir traz o tipo de cada entrada sem um stat extra por arquivo
+        with os.scandir(pasta_origem) as entradas:
+            for item in entradas:
+                if item.is_file():
+                    shutil.copy2(item.path, pasta_destino / item.name)
 
     #########################################################
     #============================================================
     # Criando pastas de dataset
     #============================================================
-    # Criar a pasta de dataset
     dataset = PROJECT_ROOT / 'dataset'
     dataset.mkdir(parents=True, exist_ok=True)
 
-    # Criar a pasta de audio_dataset
-    audio_dataset = dataset / 'audio_dataset'
-    audio_dataset.mkdir(parents=True, exist_ok=True)
-
-    # Criar a pasta de historico
-    historico_dataset = dataset / 'historico_dataset'
-    historico_dataset.mkdir(parents=True, exist_ok=True)
-
-    # Criar a pasta de log
-    log = dataset / 'log'
-    log.mkdir(parents=True, exist_ok=True)
+    for nome in SUBPASTAS_DATASET:
+        (dataset / nome).mkdir(exist_ok=True)
 
 
 if __name__ == '__main__':
-    criar_diretorios()
\ No newline at end of file
+    criar_diretorios()
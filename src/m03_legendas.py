@@ -20,17 +20,71 @@ Projeto: Katube - Sistema de Transcrição e Análise de Áudio
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Tuple
 
 # Recebendo o id do audio corrente
 id_video= 'B4RgpqJhoIo'
+
+# Caracteres lidos do início do arquivo para detectar srv3 sem carregar o XML inteiro
+CARACTERES_DETECCAO = 4096
+
+# Padrões regex compilados uma vez no import (reutilizados por todos os arquivos e linhas)
+_RE_SRT_DETECCAO = re.compile(r'^\d+\n\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}', re.MULTILINE)
+_RE_SRT_NUMERACAO = re.compile(r'^\d+\n', re.MULTILINE)
+_RE_SRT_VIRGULA = re.compile(r'(\d{2}:\d{2}:\d{2}),(\d{3})')
+_RE_LINHA_TIMESTAMP = re.compile(r'^<\d{2}:\d{2}:')
+# Timestamps internos <00:00:00.000>, tags <c>/</c> e tags não-verbais [Música] em uma única passada
+_RE_LIMPEZA = re.compile(r'<\d{2}:\d{2}:\d{2}\.\d{3}>|</?c>|\[.*?\]')
+_RE_COLCHETES = re.compile(r'\[.*?\]')
+_RE_APENAS_COLCHETES = re.compile(r'^\[.*?\]$')
+_RE_ESPACOS = re.compile(r'\s+')
+# Cabeçalhos de bloco "inicio --> fim"; o detalhado aceita configurações após o timestamp
+_RE_CABECALHO_DETALHADO = re.compile(
+    r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})[^\n]*\n'
+)
+_RE_CABECALHO_SIMPLES = re.compile(
+    r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})\n'
+)
+
+
+def _iterar_blocos(content: str, re_cabecalho: re.Pattern):
+    """
+    Percorre os blocos de legenda em uma única passada linear
+    
+    Cada cabeçalho encontrado abre um bloco cujo texto vai até a primeira
+    linha em branco (ou o fim do arquivo); a busca do próximo cabeçalho
+    continua a partir daí, sem lookahead a cada linha.
+    
+    Yields:
+        Tuplas (tempo_inicio, tempo_fim, texto_bloco) com o texto ainda sem strip
+    """
+    pos = 0
+    while True:
+        cabecalho = re_cabecalho.search(content, pos)
+        if cabecalho is None:
+            return
+        
+        inicio_texto = cabecalho.end()
+        linha_em_branco = content.find('\n\n', inicio_texto - 1)
+        if linha_em_branco != -1:
+            fim_texto = linha_em_branco + 1
+        elif content.endswith('\n'):
+            fim_texto = len(content)
+        else:
+            # Última linha sem quebra final: o bloco não fecha (mesmo comportamento do regex anterior)
+            return
+        
+        yield cabecalho.group(1), cabecalho.group(2), content[inicio_texto:fim_texto]
+        pos = fim_texto
+
 class WebVTTProcessor:
     """
     Processador universal de legendas com detecção automática de formato.
     
     Atributos:
         filepath (str): Caminho para arquivo de legenda
-        content (str): Conteúdo do arquivo carregado
+        content (str): Conteúdo do arquivo carregado (vazio para srv3)
         is_srv3 (bool): Indica se formato é srv3 (XML)
         is_srt (bool): Indica se formato é SRT
         format_type (str): Tipo específico detectado (detailed_with_speakers, simple, etc.)
@@ -42,8 +96,9 @@ class WebVTTProcessor:
     
     def __init__(self, filepath: str):
         self.filepath = filepath
-        self.content = self._read_file()
         self.is_srv3 = self._detect_srv3_format()
+        # srv3 é lido direto do arquivo pelo iterparse; o texto só é carregado para WebVTT/SRT
+        self.content = '' if self.is_srv3 else self._read_file()
         self.is_srt = False if self.is_srv3 else self._detect_srt_format()
         if self.is_srt:
             self.content = self._convert_srt_to_webvtt()
@@ -63,8 +118,17 @@ class WebVTTProcessor:
         Estrutura esperada:
             <?xml version="1.0" encoding="utf-8" ?>
             <timedtext format="3">
+        
+        Apenas o início do arquivo é lido; o restante só é consultado se o
+        cabeçalho XML existir mas a tag <timedtext> não aparecer nele.
         """
-        return self.content.strip().startswith('<?xml') and '<timedtext format="3">' in self.content
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            inicio = f.read(CARACTERES_DETECCAO)
+            if not inicio.lstrip().startswith('<?xml'):
+                return False
+            if '<timedtext format="3">' in inicio:
+                return True
+            return '<timedtext format="3">' in inicio + f.read()
         
     def _read_file(self) -> str:
         """Lê o arquivo de legenda"""
@@ -77,8 +141,7 @@ class WebVTTProcessor:
         SRT tem numeração de blocos e vírgula nos timestamps
         """
         # Verificar se tem numeração de blocos e vírgula no timestamp
-        srt_pattern = r'^\d+\n\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}'
-        return bool(re.search(srt_pattern, self.content, re.MULTILINE))
+        return bool(_RE_SRT_DETECCAO.search(self.content))
     
     def _convert_srt_to_webvtt(self) -> str:
         """
@@ -89,14 +152,10 @@ class WebVTTProcessor:
         content = self.content
         
         # Remover numeração de blocos (linhas que são apenas números)
-        content = re.sub(r'^\d+\n', '', content, flags=re.MULTILINE)
+        content = _RE_SRT_NUMERACAO.sub('', content)
         
         # Substituir vírgula por ponto nos timestamps
-        content = re.sub(
-            r'(\d{2}:\d{2}:\d{2}),(\d{3})',
-            r'\1.\2',
-            content
-        )
+        content = _RE_SRT_VIRGULA.sub(r'\1.\2', content)
         
         # Adicionar cabeçalho WEBVTT se não existir
         if not content.startswith('WEBVTT'):
@@ -126,13 +185,18 @@ class WebVTTProcessor:
             return 'simple'
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def timestamp_to_seconds(ts: str) -> float:
-        """Converte timestamp para segundos"""
-        parts = ts.strip().split(':')
-        h, m, s = int(parts[0]), int(parts[1]), float(parts[2])
-        return h * 3600 + m * 60 + s
+        """
+        Converte timestamp para segundos
+        Memorizado: o mesmo timestamp é lido mais de uma vez (fim de um bloco = início do próximo)
+        """
+        h, m, s = ts.strip().split(':')
+        return int(h) * 3600 + int(m) * 60 + float(s)
     
-    def _clean_text(self, text: str, format_type: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _clean_text(text: str, format_type: str) -> str:
         """
         Limpa o texto de acordo com o formato
         Remove tags não-verbais como [Música], [Aplausos], etc.
@@ -144,25 +208,19 @@ class WebVTTProcessor:
         Returns:
             Texto limpo
         """
-        # Remover timestamps internos <00:00:00.000>
-        text = re.sub(r'<\d{2}:\d{2}:\d{2}\.\d{3}>', '', text)
-        
-        # Remover tags <c> e </c>
-        text = re.sub(r'</?c>', '', text)
-        
-        # Substituir &nbsp; por espaço normal
+        # Substituir &nbsp; por espaço normal (literal: str.replace em C, sem regex)
         text = text.replace('&nbsp;', ' ')
         
-        # Remover tags não-verbais: [Música], [Aplausos], [Risos], etc.
-        # Padrão: qualquer coisa entre colchetes
-        text = re.sub(r'\[.*?\]', '', text)
+        # Remover timestamps internos <00:00:00.000>, tags <c>/</c> e
+        # tags não-verbais [Música], [Aplausos], [Risos], etc. (qualquer coisa entre colchetes)
+        text = _RE_LIMPEZA.sub('', text)
         
-        # Normalizar múltiplos espaços
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        # Normalizar múltiplos espaços (split sem argumento = mesmos espaços Unicode de \s)
+        return ' '.join(text.split())
     
-    def _is_non_verbal_text(self, text: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_non_verbal_text(text: str) -> bool:
         """
         Verifica se o texto é apenas tag não-verbal ou vazio
         
@@ -177,11 +235,11 @@ class WebVTTProcessor:
             return True
         
         # Apenas colchetes com conteúdo dentro
-        if re.match(r'^\[.*?\]$', text):
+        if _RE_APENAS_COLCHETES.match(text):
             return True
         
         # Após limpar tags, verifica se sobrou algo
-        cleaned = re.sub(r'\[.*?\]', '', text).strip()
+        cleaned = _RE_COLCHETES.sub('', text).strip()
         if not cleaned:
             return True
         
@@ -198,17 +256,18 @@ class WebVTTProcessor:
         Returns:
             Lista de dicionários com informações sobre sobreposições
         """
+        # Converte cada timestamp uma única vez e compara os pares consecutivos
+        # (fim do segmento i vs início do i+1) em uma varredura só
+        fins = [self.timestamp_to_seconds(seg['fim']) for seg in segments[:-1]]
+        inicios = [self.timestamp_to_seconds(seg['inicio']) for seg in segments[1:]]
+        
         overlaps = []
         
-        for i in range(len(segments) - 1):
-            current = segments[i]
-            next_seg = segments[i + 1]
-            
-            fim_atual = self.timestamp_to_seconds(current['fim'])
-            inicio_proximo = self.timestamp_to_seconds(next_seg['inicio'])
-            
+        for i, (fim_atual, inicio_proximo) in enumerate(zip(fins, inicios)):
             # Sobreposição ocorre quando fim_atual > inicio_proximo
             if fim_atual > inicio_proximo:
+                current = segments[i]
+                next_seg = segments[i + 1]
                 sobreposicao = fim_atual - inicio_proximo
                 overlaps.append({
                     'index': i,
@@ -228,25 +287,20 @@ class WebVTTProcessor:
         Funciona para formatos com ou sem marcadores de locutor
         Filtra tags não-verbais como [Música]
         """
-        pattern = r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})[^\n]*\n((?:.*\n)*?)(?=\n\d{2}:\d{2}:\d{2}\.\d{3}|$)'
-        matches = re.finditer(pattern, self.content, re.MULTILINE)
-        
         blocos_raw = []
         
-        for match in matches:
-            tempo_inicio = match.group(1)
-            tempo_fim = match.group(2)
+        for tempo_inicio, tempo_fim, texto_bloco in _iterar_blocos(self.content, _RE_CABECALHO_DETALHADO):
             
             # Limitar por tempo se especificado
             if max_seconds and self.timestamp_to_seconds(tempo_inicio) > max_seconds:
                 break
             
-            texto_bloco = match.group(3).strip()
+            texto_bloco = texto_bloco.strip()
             linhas = [l.strip() for l in texto_bloco.split('\n') if l.strip()]
             
             for linha in linhas:
                 # Pular linhas com apenas timestamps internos ou vazias
-                if re.match(r'^<\d{2}:\d{2}:', linha) or linha == ' ':
+                if _RE_LINHA_TIMESTAMP.match(linha) or linha == ' ':
                     continue
                 
                 # Verificar se é tag não-verbal ANTES de limpar
@@ -311,82 +365,77 @@ class WebVTTProcessor:
         """
         import xml.etree.ElementTree as ET
         
-        # Parse XML
-        try:
-            root = ET.fromstring(self.content)
-        except Exception as e:
-            print(f"Erro ao parsear XML: {e}")
-            return []
-        
         segments = []
         primeiro_bloco = True
         
-        # Procurar tag <body>
-        body = root.find('body')
-        if body is None:
+        # Parse incremental (expat em C): cada <p> é processado e descartado ao fechar,
+        # sem montar a árvore inteira; max_seconds interrompe a leitura do arquivo
+        try:
+            for _, p in ET.iterparse(self.filepath, events=('end',)):
+                # Apenas tags <p> (parágrafos/blocos); <s> chegam como filhos do <p>
+                if p.tag != 'p':
+                    continue
+                
+                # Atributos: t=tempo_inicio_ms, d=duracao_ms
+                t_ms = p.get('t')
+                d_ms = p.get('d')
+                
+                # Extrair texto
+                # Pode ter <s> tags (automática) ou texto direto (manual)
+                s_tags = p.findall('s')
+                
+                if s_tags:
+                    # Legenda automática: palavra por palavra em <s>
+                    texto_completo = ''.join(s.text or '' for s in s_tags).strip()
+                else:
+                    # Legenda manual: texto direto
+                    texto_completo = ''.join(p.itertext()).strip()
+                
+                # Libera o bloco já lido (memória constante em legendas longas)
+                p.clear()
+                
+                if not t_ms or not d_ms:
+                    continue
+                
+                t_ms = int(t_ms)
+                d_ms = int(d_ms)
+                
+                # Limitar por tempo
+                if max_seconds and (t_ms / 1000.0) > max_seconds:
+                    break
+                
+                # Verificar se é tag não-verbal
+                if self._is_non_verbal_text(texto_completo):
+                    continue
+                
+                # Limpar texto
+                texto_limpo = self._clean_text(texto_completo, 'srv3')
+                
+                if not texto_limpo:
+                    continue
+                
+                # Converter milissegundos para timestamp
+                inicio = self._ms_to_timestamp(t_ms)
+                fim = self._ms_to_timestamp(t_ms + d_ms)
+                
+                # Detectar início de locutor (hífens em manuais)
+                comeca_locutor = primeiro_bloco or texto_limpo.startswith('-')
+                
+                # Remover hífens iniciais (texto já normalizado: o único espaço é ' ')
+                texto_limpo = texto_limpo.lstrip('- ')
+                
+                segments.append({
+                    'texto': texto_limpo,
+                    'inicio': inicio,
+                    'fim': fim,
+                    'comeca_locutor': comeca_locutor
+                })
+                
+                primeiro_bloco = False
+        except ET.ParseError as e:
+            print(f"Erro ao parsear XML: {e}")
             return []
         
-        # Iterar sobre tags <p> (parágrafos/blocos)
-        for p in body.findall('p'):
-            # Atributos: t=tempo_inicio_ms, d=duracao_ms
-            t_ms = p.get('t')
-            d_ms = p.get('d')
-            
-            if not t_ms or not d_ms:
-                continue
-            
-            t_ms = int(t_ms)
-            d_ms = int(d_ms)
-            
-            # Limitar por tempo
-            if max_seconds and (t_ms / 1000.0) > max_seconds:
-                break
-            
-            # Extrair texto
-            # Pode ter <s> tags (automática) ou texto direto (manual)
-            s_tags = p.findall('s')
-            
-            if s_tags:
-                # Legenda automática: palavra por palavra em <s>
-                palavras = []
-                for s in s_tags:
-                    texto = s.text or ''
-                    palavras.append(texto)
-                texto_completo = ''.join(palavras).strip()
-            else:
-                # Legenda manual: texto direto
-                texto_completo = ''.join(p.itertext()).strip()
-            
-            # Verificar se é tag não-verbal
-            if self._is_non_verbal_text(texto_completo):
-                continue
-            
-            # Limpar texto
-            texto_limpo = self._clean_text(texto_completo, 'srv3')
-            
-            if not texto_limpo:
-                continue
-            
-            # Converter milissegundos para timestamp
-            inicio = self._ms_to_timestamp(t_ms)
-            fim = self._ms_to_timestamp(t_ms + d_ms)
-            
-            # Detectar início de locutor (hífens em manuais)
-            comeca_locutor = primeiro_bloco or texto_limpo.startswith('-')
-            
-            # Remover hífens iniciais
-            while texto_limpo.startswith('-'):
-                texto_limpo = texto_limpo[1:].strip()
-            
-            segments.append({
-                'texto': texto_limpo,
-                'inicio': inicio,
-                'fim': fim,
-                'comeca_locutor': comeca_locutor
-            })
-            
-            primeiro_bloco = False
-        
         return segments
     
     def _ms_to_timestamp(self, ms: int) -> str:
@@ -405,21 +454,16 @@ class WebVTTProcessor:
         MANTÉM múltiplas falas do mesmo bloco juntas (não separa hífens do mesmo timestamp)
         Filtra tags não-verbais como [Música]
         """
-        pattern = r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})\n((?:.*\n)*?)(?=\n\d{2}:\d{2}:\d{2}\.\d{3}|$)'
-        matches = re.finditer(pattern, self.content, re.MULTILINE)
-        
         trechos = []
         primeiro_bloco = True
         
-        for match in matches:
-            tempo_inicio = match.group(1)
-            tempo_fim = match.group(2)
+        for tempo_inicio, tempo_fim, texto_bloco in _iterar_blocos(self.content, _RE_CABECALHO_SIMPLES):
             
             # Limitar por tempo se especificado
             if max_seconds and self.timestamp_to_seconds(tempo_inicio) > max_seconds:
                 break
             
-            texto_bloco = match.group(3).strip()
+            texto_bloco = texto_bloco.strip()
             
             # Verificar se é apenas tag não-verbal
             if self._is_non_verbal_text(texto_bloco):
@@ -431,15 +475,15 @@ class WebVTTProcessor:
             # Limpar o texto
             texto_limpo = self._clean_text(texto_bloco, self.format_type)
             texto_limpo = texto_limpo.replace('\n', ' ')
-            texto_limpo = re.sub(r'\s+', ' ', texto_limpo)
+            texto_limpo = _RE_ESPACOS.sub(' ', texto_limpo)
             
             # Remover >> se tiver
             texto_limpo = texto_limpo.replace('>>', '').strip()
             
             # Remover TODOS os hífens iniciais (podem ser múltiplos)
             # Ex: "- Fala - E aí" → "Fala - E aí" (mantém hífen do meio)
-            while texto_limpo.startswith('-'):
-                texto_limpo = texto_limpo[1:].strip()
+            # Uma passada só: após _clean_text o único espaço possível é ' '
+            texto_limpo = texto_limpo.lstrip('- ')
             
             # Verificar novamente após limpeza
             if not texto_limpo or self._is_non_verbal_text(texto_limpo):
@@ -476,8 +520,9 @@ class WebVTTProcessor:
         if not segments:
             return segments
         
-        # Identificar índices de blocos sem fala (gaps)
-        gap_indices = set()
+        # Máscara de remoção: cada gap marca a si mesmo e a vizinhança (2 antes e 2 depois)
+        total = len(segments)
+        remover = [False] * total
         
         for i, seg in enumerate(segments):
             texto = seg['texto'].strip()
@@ -486,32 +531,12 @@ class WebVTTProcessor:
             # - Vazio OU
             # - Contém apenas tags não-verbais
             if not texto or self._is_non_verbal_text(texto):
-                gap_indices.add(i)
+                inicio = max(0, i - 2)
+                fim = min(total, i + 3)
+                remover[inicio:fim] = [True] * (fim - inicio)
         
-        # Expandir gaps: adicionar 2 antes e 2 depois de cada gap
-        expanded_indices = set()
-        
-        for gap_idx in gap_indices:
-            # Adicionar o próprio gap
-            expanded_indices.add(gap_idx)
-            
-            # 2 antes
-            if gap_idx - 1 >= 0:
-                expanded_indices.add(gap_idx - 1)
-            if gap_idx - 2 >= 0:
-                expanded_indices.add(gap_idx - 2)
-            
-            # 2 depois
-            if gap_idx + 1 < len(segments):
-                expanded_indices.add(gap_idx + 1)
-            if gap_idx + 2 < len(segments):
-                expanded_indices.add(gap_idx + 2)
-        
-        # Filtrar: manter apenas índices NÃO expandidos
-        filtered = []
-        for i, seg in enumerate(segments):
-            if i not in expanded_indices:
-                filtered.append(seg)
+        # Filtrar: manter apenas índices fora da vizinhança de algum gap
+        filtered = [seg for seg, descartar in zip(segments, remover) if not descartar]
         
         return filtered
     
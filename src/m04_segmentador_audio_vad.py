@@ -13,7 +13,20 @@ import torchaudio
 
 # Importar configurações do projeto
 sys.path.append(str(Path(__file__).parent.parent))
-from config import SEGMENTADOR_AUDIO_VAD, PROJECT_ROOT
+from config import (
+    PROJECT_ROOT,
+    VAD_VOICE_THRESHOLD,
+    VAD_WINDOW_SIZE_SECONDS,
+    VAD_MIN_SPEECH_DURATION_MS,
+    VAD_MIN_SILENCE_DURATION_MS,
+    VAD_MIN_SILENCE_FOR_SPLIT,
+    VAD_PADDING_INICIO_MS,
+    VAD_PADDING_FIM_MS,
+    VAD_MIN_SEG,
+    VAD_MAX_SEG,
+    VAD_TOLERANCIA,
+    VAD_SOBRESCREVER,
+)
 
 id_video = 'QN7gUP7nYhQ'
 
@@ -31,9 +44,6 @@ PASTA_DESTINO = PROJECT_ROOT / "arquivos" / "temp" / id_video / "02-segmentos_or
 # CONFIGURAÇÕES
 # =============================================================================
 
-# Carregar configurações do VAD
-CFG = SEGMENTADOR_AUDIO_VAD
-
 # Sample rate fixo para VAD (Silero-VAD otimizado para 16kHz)
 VAD_SAMPLE_RATE = 16000
 
@@ -179,12 +189,12 @@ def detectar_fala_vad(caminho_audio: Path, model, utils) -> list:
     speech_timestamps = get_speech_timestamps(
         wav,
         model,
-        threshold=CFG['deteccao']['voice_threshold'],
+        threshold=VAD_VOICE_THRESHOLD,
         sampling_rate=VAD_SAMPLE_RATE,
-        min_speech_duration_ms=CFG['criterios']['min_speech_duration_ms'],
-        min_silence_duration_ms=CFG['criterios']['min_silence_duration_ms'],
-        window_size_samples=int(CFG['deteccao']['window_size_seconds'] * VAD_SAMPLE_RATE),
-        speech_pad_ms=CFG['padding']['inicio_ms']  # Padding será aplicado depois
+        min_speech_duration_ms=VAD_MIN_SPEECH_DURATION_MS,
+        min_silence_duration_ms=VAD_MIN_SILENCE_DURATION_MS,
+        window_size_samples=int(VAD_WINDOW_SIZE_SECONDS * VAD_SAMPLE_RATE),
+        speech_pad_ms=VAD_PADDING_INICIO_MS  # Padding será aplicado depois
     )
     
     # Converter de samples para segundos
@@ -218,12 +228,12 @@ def agrupar_segmentos_vad(segmentos_fala: list, duracao_total: float) -> list:
         return []
     
     # Configurações
-    min_seg = CFG['segmentos']['min_seg']
-    max_seg = CFG['segmentos']['max_seg']
-    tolerancia = CFG['segmentos']['tolerancia']
-    min_silence_split = CFG['criterios']['min_silence_for_split']
-    padding_inicio = CFG['padding']['inicio_ms'] / 1000.0  # Converter para segundos
-    padding_fim = CFG['padding']['fim_ms'] / 1000.0
+    min_seg = VAD_MIN_SEG
+    max_seg = VAD_MAX_SEG
+    tolerancia = VAD_TOLERANCIA
+    min_silence_split = VAD_MIN_SILENCE_FOR_SPLIT
+    padding_inicio = VAD_PADDING_INICIO_MS / 1000.0  # Converter para segundos
+    padding_fim = VAD_PADDING_FIM_MS / 1000.0
     
     segmentos_finais = []
     i = 0
@@ -395,7 +405,7 @@ def executar_segmentacao_vad():
     print(f"{'='*70}")
     
     # Verificar se deve sobrescrever
-    if not CFG['comportamento']['sobrescrever']:
+    if not VAD_SOBRESCREVER:
         if pasta_destino.exists() and any(pasta_destino.iterdir()):
             print(f"Pasta de destino já contém arquivos. Pulando (sobrescrever=False)")
             return
@@ -128,16 +128,16 @@ def carregar_json_input(json_path: Path) -> Dict:
     return dados
 
 
-def preparar_audio(audio_path: Path, device: torch.device) -> torch.Tensor:
+def preparar_audio(audio_path: Path) -> torch.Tensor:
     """
     Carrega e prepara áudio para processamento SQUIM.
     
     Args:
         audio_path: Caminho para o arquivo de áudio
-        device: Dispositivo onde colocar tensor
         
     Returns:
-        torch.Tensor: Áudio preparado (1, samples) em 16kHz
+        torch.Tensor: Áudio preparado (1, samples) em 16kHz, em CPU
+        (a cópia para o device é feita uma vez por batch em calcular_mos_batch)
     """
     # Carrega áudio (já deve estar em 16kHz)
     audio, sr = torchaudio.load(audio_path)
@@ -163,7 +163,7 @@ def preparar_audio(audio_path: Path, device: torch.device) -> torch.Tensor:
         # Trunca se muito longo
         audio = audio[:, :target_samples]
     
-    return audio.to(device)
+    return audio
 
 
 def calcular_mos_batch(
@@ -182,11 +182,15 @@ def calcular_mos_batch(
     Returns:
         List[Dict]: Lista de dicionários com métricas para cada áudio
     """
-    # Empilha áudios em batch (batch, 192000)
-    batch = torch.cat(audios, dim=0).to(device)
+    # Empilha áudios em batch (batch, 192000) ainda em CPU
+    batch = torch.cat(audios, dim=0)
+    
+    # GPU: uma única cópia por batch, a partir de memória fixada (DMA assíncrono)
+    if device.type == 'cuda':
+        batch = batch.pin_memory().to(device, non_blocking=True)
     
     # Processa batch
-    with torch.no_grad():
+    with torch.inference_mode():
         stoi, pesq, si_sdr = model(batch)
     
     # Converte resultados para lista de dicionários
@@ -265,7 +269,7 @@ def processar_segmentos(
                 logger.error(f"Arquivo de áudio não encontrado: {audio_path}")
                 raise FileNotFoundError(f"Arquivo de áudio não encontrado: {audio_path}")
             
-            audio = preparar_audio(audio_path, device)
+            audio = preparar_audio(audio_path)
             batch_audios.append(audio)
             batch_names.append(nome_arquivo)
         
@@ -309,8 +309,10 @@ def transcrever_batch(pipe: pipeline,
         # Transcrever batch
         if audios:
             try:
-                # Pipeline aceita lista de arrays
-                outputs = pipe(audios, generate_kwargs={"language": "pt", "task": "transcribe"})
+                # Pipeline aceita lista de arrays; batch_size faz o forward em lote
+                # (sem ele o pipeline percorre a lista um audio por vez)
+                outputs = pipe(audios, batch_size=batch_size,
+                               generate_kwargs={"language": "pt", "task": "transcribe"})
                 
                 # Extrair transcricoes
                 for nome, output in zip(nomes, outputs):
@@ -8,7 +8,7 @@ Adiciona campo 'stt_wav2vec' aos metadados JSON
 import sys
 import json
 from pathlib import Path
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 import shutil
 
 import torch
@@ -68,6 +68,24 @@ def obter_device() -> str:
         return "cpu"
 
 
+def obter_batch_size(device: str) -> int:
+    """
+    Obtem o batch_size final considerando config e device
+    
+    Args:
+        device: 'cuda' ou 'cpu'
+        
+    Returns:
+        Batch size a ser usado
+    """
+    # CPU sempre usa batch_size=1
+    if device == 'cpu':
+        return 1
+    
+    batch_config = STT_WAV2VEC2['batch']['batch_size']
+    return 8 if batch_config == 'auto' else int(batch_config)
+
+
 # ==============================================================================
 # FUNCOES DE LEITURA DE JSON
 # ==============================================================================
@@ -128,6 +146,30 @@ def obter_segmentos_elegiveis() -> tuple[Dict, Set[str]]:
 # FUNCAO DE TRANSCRICAO
 # ==============================================================================
 
+def transcrever_individualmente(pipe, lote: List[Tuple[int, str, Path]], total: int) -> List[Optional[Dict]]:
+    """
+    Fallback de um lote que falhou: transcreve arquivo a arquivo
+    
+    Args:
+        pipe: Pipeline wav2vec2
+        lote: Lista de (indice, chave_segmento, caminho_audio)
+        total: Total de segmentos (para o log)
+        
+    Returns:
+        Resultados na ordem do lote (None nos arquivos que falharam)
+    """
+    resultados = []
+    
+    for processados, chave_segmento, caminho_audio in lote:
+        try:
+            resultados.append(pipe(str(caminho_audio)))
+        except Exception as e:
+            print(f"[{processados}/{total}] ERRO ao transcrever {chave_segmento}: {e}")
+            resultados.append(None)
+    
+    return resultados
+
+
 def transcrever_segmentos(dados_acompanhamento: Dict, segmentos_elegiveis: Set[str]) -> tuple[Dict, Dict]:
     """
     Transcreve os segmentos elegiveis usando wav2vec2
@@ -153,21 +195,19 @@ def transcrever_segmentos(dados_acompanhamento: Dict, segmentos_elegiveis: Set[s
         device = 'cpu'
         device_id = -1
     
+    batch_size = obter_batch_size(device)
     print(f"Usando device: {device}")
+    print(f"Batch size: {batch_size}")
     print("Modelo carregado com sucesso\n")
     
     # Preparar outputs
     dados_acompanhamento_output = dados_acompanhamento.copy()
     dados_wav2vec_output = {}
     
-    # Processar cada segmento
+    # Separar segmentos a transcrever (preserva a ordem do acompanhamento)
     total = len(dados_acompanhamento)
-    processados = 0
-    transcricoes_realizadas = 0
-    
-    for chave_segmento, metadados in dados_acompanhamento.items():
-        processados += 1
-        
+    pendentes = []
+    for processados, chave_segmento in enumerate(dados_acompanhamento, 1):
         # Verificar se eh elegivel
         if chave_segmento not in segmentos_elegiveis:
             dados_acompanhamento_output[chave_segmento]["stt_wav2vec"] = None
@@ -181,24 +221,41 @@ def transcrever_segmentos(dados_acompanhamento: Dict, segmentos_elegiveis: Set[s
             dados_acompanhamento_output[chave_segmento]["stt_wav2vec"] = None
             continue
         
-        # Transcrever
+        pendentes.append((processados, chave_segmento, caminho_audio))
+    
+    # Transcrever em lotes: o pipeline so agrupa o forward quando recebe uma lista com batch_size
+    transcricoes_realizadas = 0
+    for i in range(0, len(pendentes), batch_size):
+        lote = pendentes[i:i + batch_size]
+        
         try:
-            resultado = pipe(str(caminho_audio))
+            resultados = pipe([str(caminho) for _, _, caminho in lote], batch_size=batch_size)
+        except Exception as e:
+            if len(lote) == 1:
+                processados, chave_segmento, _ = lote[0]
+                print(f"[{processados}/{total}] ERRO ao transcrever {chave_segmento}: {e}")
+                resultados = [None]
+            else:
+                # Um arquivo ruim (ou OOM) nao descarta o lote: so o segmento que falhar fica None
+                print(f"AVISO: falha no lote de {len(lote)} arquivos ({e}); reprocessando um a um")
+                resultados = transcrever_individualmente(pipe, lote, total)
+        
+        for (processados, chave_segmento, _), resultado in zip(lote, resultados):
+            if resultado is None:
+                dados_acompanhamento_output[chave_segmento]["stt_wav2vec"] = None
+                continue
+            
             transcricao = resultado["text"]
             
             # Adicionar transcricao aos outputs
             dados_acompanhamento_output[chave_segmento]["stt_wav2vec"] = transcricao
             
             # Criar entrada para arquivo wav2vec (somente elegiveis)
-            dados_wav2vec_output[chave_segmento] = metadados.copy()
+            dados_wav2vec_output[chave_segmento] = dados_acompanhamento[chave_segmento].copy()
             dados_wav2vec_output[chave_segmento]["stt_wav2vec"] = transcricao
             
             transcricoes_realizadas += 1
             print(f"[{processados}/{total}] Transcrito: {chave_segmento}")
-            
-        except Exception as e:
-            print(f"[{processados}/{total}] ERRO ao transcrever {chave_segmento}: {e}")
-            dados_acompanhamento_output[chave_segmento]["stt_wav2vec"] = None
     
     print(f"\nResumo: {transcricoes_realizadas} transcricoes realizadas de {len(segmentos_elegiveis)} elegiveis")
     
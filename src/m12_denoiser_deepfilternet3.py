@@ -129,7 +129,7 @@ def processar_audio_denoiser(
     audio_tensor = torch.from_numpy(audio).unsqueeze(0)  # Shape: (1, samples)
     
     # Aplica denoising
-    with torch.no_grad():
+    with torch.inference_mode():
         audio_denoised = enhance(
             model,
             df_state,